@@ -11,11 +11,17 @@ from ctypes import wintypes
 from PIL import Image
 import pystray
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import json
+import atexit
+import copy
+import tempfile
+from collections import deque
+import functools
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional, List, Dict
-from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Optional, List, Dict, Tuple, Union, Callable
 import time
 
 # Windows registry for startup
@@ -24,6 +30,18 @@ try:
 except Exception:
     winreg = None
 
+# Optional fast JSON; both paths take/return bytes and write the same UTF-8 text
+try:
+    import orjson
+    _loads = orjson.loads
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    orjson = None
+    _loads = json.loads
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 # ==============================================================================
 # --- 0. DATA STRUCTURES & PERSISTENCE ---
 # ==============================================================================
@@ -31,6 +49,7 @@ APP_DIR = Path(__file__).resolve().parent
 SETTINGS_FILE = APP_DIR / "wallch_settings.json"
 STATUS_FILE = APP_DIR / "wallch.status"
 CMD_FILE = APP_DIR / "wallch.cmd"
+WALLCH_CMD_EVENT = "Local\\wallch::cmd"  # auto-reset event wallch.py waits on (same name there)
 APPS_CONFIG_FILE = APP_DIR / "apps.json"
 
 # NEW: state/profiles/logs
@@ -38,24 +57,30 @@ STATE_FILE = APP_DIR / "control.state.json"
 PROFILES_FILE = APP_DIR / "profiles.json"
 LOG_DIR = APP_DIR / "logs"
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     name: str
     process_name: str
     type: str = "standard"
     cwd: Optional[str] = None
-    command: Optional[str] = None
+    command: Optional[Union[str, List[str]]] = None  # argv list, or legacy shell string
     path: Optional[str] = None
     script: Optional[str] = None
 
     def to_dict(self):
-        return {k: v for k, v in self.__dict__.items()}
+        return {f: getattr(self, f) for f in _APP_CONFIG_FIELDS}
+
+_APP_CONFIG_FIELDS = tuple(f.name for f in fields(AppConfig))
 
 DEFAULT_WALLCH_SETTINGS = {
     "folder": "", "interval": 300, "style": "fill",
     "shuffle": True, "recursive": False, "once": False
 }
 
+# Lowercased once; snapshot names and joined cmdlines are already lowercase
+_PY_EXE_NAMES = frozenset({'python.exe', 'pythonw.exe'})
+_SELF_SCRIPT_MARKERS = ('control.py', 'control.pyw')
+
 def _ensure_dirs():
     try:
         LOG_DIR.mkdir(exist_ok=True)
@@ -65,59 +90,154 @@ def _ensure_dirs():
 def _kill_other_control_instances():
     """Terminate any other running control.py instances (python/pythonw) except this PID."""
     my_pid = os.getpid()
+    snap = get_system_snapshot(max_age=0)
     targets = []
-    for p in psutil.process_iter(['pid', 'name', 'cmdline']):
-        try:
-            if p.pid == my_pid:
+    for name in _PY_EXE_NAMES:
+        for pid in snap.by_name.get(name, []):
+            if pid == my_pid:
                 continue
-            name = (p.info.get('name') or '').lower()
-            if name not in ('python.exe', 'pythonw.exe'):
-                continue
-            cmd = [c.lower() for c in (p.info.get('cmdline') or []) if c]
-            if any('control.py' in part or 'control.pyw' in part for part in cmd):
-                targets.append(p)
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
+            joined = snap.get_cmdline_lower(pid)
+            if any(m in joined for m in _SELF_SCRIPT_MARKERS):
+                p = snap.get_proc(pid)
+                if p is not None:
+                    targets.append(p)
     for p in targets:
         try: p.terminate()
         except Exception: pass
-    gone, alive = psutil.wait_procs(targets, timeout=2.5)
+    alive = _wait_procs(targets, 2.5)
     for p in alive:
         try: p.kill()
         except Exception: pass
 
+# Set once older instances are gone; launching/restarting apps waits for it
+_single_instance_ready = threading.Event()
+
+def _kill_other_control_instances_async():
+    """Thread target: run the instance cleanup off the UI thread, then release the gate."""
+    try:
+        _kill_other_control_instances()
+    finally:
+        _single_instance_ready.set()
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    """Write to a uniquely named temp sibling, then os.replace: readers see the old or new
+    file, never a torn one, and concurrent writers never share a temp file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try: os.unlink(tmp)
+        except OSError: pass
+        raise
+
+class DebouncedJsonWriter:
+    """Coalesce JSON saves: each mark() replaces the pending content for a path and
+    re-arms one timer; the flush writes every pending file atomically (tmp + replace).
+    Write failures go to `on_error(path, exc)` (may be called from the timer thread)."""
+    def __init__(self, delay: float = 0.2):
+        self.delay = delay
+        self._pending: Dict[Path, bytes] = {}
+        self._lock = threading.Lock()      # guards _pending/_timer
+        self._io_lock = threading.Lock()   # one flush writes at a time, so writes land in mark() order
+        self._timer: Optional[threading.Timer] = None
+        self.on_error: Optional[Callable[[Path, Exception], None]] = None
+
+    def mark(self, path: Path, data):
+        # Serialize now so later in-place mutations of `data` can't race the flush.
+        payload = _dumps(data)
+        with self._lock:
+            self._pending[path] = payload
+            if self._timer:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self, path: Optional[Path] = None):
+        """Write pending files now (only `path` if given)."""
+        errors = []
+        with self._io_lock:
+            # Pop under the io lock too: a timer flush that already took an older payload
+            # finishes writing it before this flush can take (and write) the newer one.
+            with self._lock:
+                if path is None:
+                    items = list(self._pending.items())
+                    self._pending.clear()
+                elif path in self._pending:
+                    items = [(path, self._pending.pop(path))]
+                else:
+                    items = []
+            for p, payload in items:
+                try:
+                    _atomic_write_bytes(p, payload)
+                except Exception as e:
+                    print(f"Failed to save {p.name}: {e}")
+                    errors.append((p, e))
+        # Reported outside the locks: the hook may wait on the Tk thread, which may itself
+        # be waiting in flush()
+        if errors and self.on_error:
+            for p, e in errors:
+                try: self.on_error(p, e)
+                except Exception: pass
+
+_json_writer = DebouncedJsonWriter()
+atexit.register(_json_writer.flush)
+
 # --- basic IO ---
+_json_cache: Dict[Path, Tuple[Tuple[int, int], object]] = {}
+
+def _cached_json(p: Path):
+    """Parse a JSON file, reusing the last result while its mtime/size are unchanged.
+    Returns a deep copy so callers may mutate it freely."""
+    st = p.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _json_cache.get(p)
+    if hit and hit[0] == key:
+        return copy.deepcopy(hit[1])
+    data = _loads(p.read_bytes())
+    _json_cache[p] = (key, data)
+    return copy.deepcopy(data)
+
+def _try_read_json(p: Path, default):
+    """Parse p, or return default if it is missing/unreadable/invalid (no exists() pre-check)."""
+    try:
+        return _loads(p.read_bytes())
+    except (OSError, ValueError):
+        return default
+
 def load_wallch_settings():
-    if SETTINGS_FILE.exists():
-        try:
-            data = json.loads(SETTINGS_FILE.read_text(encoding="utf-8"))
-            data.setdefault("folder", "")
-            return data
-        except Exception:
-            pass
-    return DEFAULT_WALLCH_SETTINGS.copy()
+    _json_writer.flush(SETTINGS_FILE)
+    try:
+        data = _cached_json(SETTINGS_FILE)
+        data.setdefault("folder", "")
+        return data
+    except Exception:
+        return DEFAULT_WALLCH_SETTINGS.copy()
 
 def save_wallch_settings(data: dict):
     try:
-        SETTINGS_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        _json_writer.mark(SETTINGS_FILE, data)
     except Exception as e:
         print(f"Failed to save settings: {e}")
 
 def load_apps_from_json() -> List[AppConfig]:
-    if not APPS_CONFIG_FILE.exists():
-        return []
+    """Parse apps.json without any UI (safe off the Tk thread); raises on bad content."""
+    _json_writer.flush(APPS_CONFIG_FILE)
     try:
-        data = json.loads(APPS_CONFIG_FILE.read_text(encoding="utf-8"))
-        for app_data in data:
-            if app_data.get('script') == 'wallch.py':
-                settings = load_wallch_settings()
-                app_data['command'] = build_wallch_command(settings)
-                if app_data.get('cwd') == '.':
-                    app_data['cwd'] = str(APP_DIR)
-        return [AppConfig(**item) for item in data]
-    except (json.JSONDecodeError, TypeError) as e:
-        messagebox.showerror("Config Error", f"Failed to load 'apps.json':\n{e}")
+        data = _cached_json(APPS_CONFIG_FILE)
+    except FileNotFoundError:
         return []
+    settings = None
+    for app_data in data:
+        if app_data.get('script') == 'wallch.py':
+            if settings is None:
+                settings = load_wallch_settings()
+            app_data['command'] = build_wallch_command(settings)
+            if app_data.get('cwd') == '.':
+                app_data['cwd'] = str(APP_DIR)
+    return [AppConfig(**item) for item in data]
 
 def save_apps_to_json(apps: List[AppConfig]):
     try:
@@ -129,125 +249,352 @@ def save_apps_to_json(apps: List[AppConfig]):
                 if app_dict.get('cwd') == str(APP_DIR):
                     app_dict['cwd'] = "."
             app_list_to_save.append(app_dict)
-        APPS_CONFIG_FILE.write_text(json.dumps(app_list_to_save, indent=2), encoding="utf-8")
+        _json_writer.mark(APPS_CONFIG_FILE, app_list_to_save)
     except Exception as e:
         messagebox.showerror("Save Error", f"Could not save to 'apps.json':\n{e}")
 
-def build_wallch_command(settings: dict) -> str:
-    folder, interval, style = settings["folder"], int(settings["interval"]), settings["style"]
-    args = [f'"{folder}"', f"--interval {max(1, interval)}", f"--style {style}"]
-    if settings["shuffle"]:   args.append("--shuffle")
-    if settings["recursive"]: args.append("--recursive")
-    if settings["once"]:      args.append("--once")
-    return f'start "" pythonw.exe wallch.py ' + " ".join(args)
+@functools.lru_cache(maxsize=8)
+def _wallch_argv(folder: str, interval: int, style: str, shuffle: bool, recursive: bool, once: bool) -> Tuple[str, ...]:
+    args = ["pythonw.exe", "wallch.py", folder, "--interval", str(max(1, interval)), "--style", style]
+    if shuffle:   args.append("--shuffle")
+    if recursive: args.append("--recursive")
+    if once:      args.append("--once")
+    return tuple(args)
+
+def build_wallch_command(settings: dict) -> List[str]:
+    """argv for the wallpaper daemon; launched directly, no cmd.exe in between."""
+    return list(_wallch_argv(settings["folder"], int(settings["interval"]), settings["style"],
+                             bool(settings["shuffle"]), bool(settings["recursive"]), bool(settings["once"])))
+
+_status_cache = (None, "Unknown")  # ((mtime_ns, size), status)
 
 def read_wallch_status() -> str:
+    """Status written by wallch.py; re-read only when the file's mtime/size change."""
+    global _status_cache
     try:
-        return STATUS_FILE.read_text(encoding="utf-8").strip() if STATUS_FILE.exists() else "Unknown"
-    except Exception:
+        st = STATUS_FILE.stat()
+    except OSError:
         return "Unknown"
+    key = (st.st_mtime_ns, st.st_size)
+    if key == _status_cache[0]:
+        return _status_cache[1]
+    try:
+        status = STATUS_FILE.read_text(encoding="utf-8").strip()
+    except Exception:
+        status = "Unknown"
+    _status_cache = (key, status)
+    return status
 
 def send_wallch_command(text: str):
     try:
-        CMD_FILE.write_text(text.strip() + "\n", encoding="utf-8")
+        # Plain write: one word the daemon deletes once read. A replace-based atomic write
+        # would fail on Windows while wallch has the file open.
+        CMD_FILE.write_bytes((text.strip() + "\n").encode("utf-8"))
     except Exception as e:
         print(f"Failed to send command '{text}': {e}")
+        return
+    _signal_wallch()
+
+def _signal_wallch():
+    """Wake wallch.py so it reads the command file now (no-op if it isn't running)."""
+    if _kernel32 is None:
+        return
+    h = _kernel32.OpenEventW(EVENT_MODIFY_STATE, False, WALLCH_CMD_EVENT)
+    if h:
+        _kernel32.SetEvent(h)
+        _kernel32.CloseHandle(h)
 
 # ==============================================================================
 # --- 1. PROCESS MANAGEMENT + LOGGING + AUTORESTART
 # ==============================================================================
-def _aggregate_proc_dict():
-    """Collect ALL processes by name -> [psutil.Process, ...] (no overwrites)."""
-    procs = defaultdict(list)
+# Win32 process primitives (ctypes): Toolhelp32 name walk + kernel-signalled exit waits
+SYNCHRONIZE = 0x00100000
+ERROR_INVALID_PARAMETER = 87  # OpenProcess on a pid that no longer exists
+EVENT_MODIFY_STATE = 0x0002
+WAIT_OBJECT_0 = 0
+MAXIMUM_WAIT_OBJECTS = 64
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", ctypes.c_long),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", ctypes.c_wchar * 260),
+    ]
+
+if os.name == "nt":
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+    _kernel32.WaitForMultipleObjects.argtypes = (wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE), wintypes.BOOL, wintypes.DWORD)
+    _kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    _kernel32.WaitForSingleObject.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    _kernel32.OpenEventW.restype = wintypes.HANDLE
+    _kernel32.OpenEventW.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.LPCWSTR)
+    _kernel32.SetEvent.argtypes = (wintypes.HANDLE,)
+    _kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    _kernel32.CreateToolhelp32Snapshot.argtypes = (wintypes.DWORD, wintypes.DWORD)
+    for _fn in (_kernel32.Process32FirstW, _kernel32.Process32NextW):
+        _fn.restype = wintypes.BOOL
+        _fn.argtypes = (wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W))
+else:
+    _kernel32 = None
+
+def _wait_procs(procs: List[psutil.Process], timeout: float) -> List[psutil.Process]:
+    """Wait up to `timeout` seconds for procs to exit; return the ones still alive.
+    Windows: one WaitForMultipleObjects per 64 handles. Elsewhere: psutil.wait_procs."""
+    if _kernel32 is None or not procs:
+        return psutil.wait_procs(procs, timeout=timeout)[1]
+    handles = {}
+    unwaitable = []  # alive but not openable (elevated / other user): psutil polls these
+    for p in procs:
+        h = _kernel32.OpenProcess(SYNCHRONIZE, False, p.pid)
+        if h:
+            handles[p] = h
+        elif ctypes.get_last_error() != ERROR_INVALID_PARAMETER:  # INVALID_PARAMETER -> already gone
+            unwaitable.append(p)
+    try:
+        deadline = time.monotonic() + timeout
+        items = list(handles.values())
+        for i in range(0, len(items), MAXIMUM_WAIT_OBJECTS):
+            batch = items[i:i + MAXIMUM_WAIT_OBJECTS]
+            ms = max(0, int((deadline - time.monotonic()) * 1000))
+            _kernel32.WaitForMultipleObjects(len(batch), (wintypes.HANDLE * len(batch))(*batch), True, ms)
+        alive = [p for p, h in handles.items() if _kernel32.WaitForSingleObject(h, 0) != WAIT_OBJECT_0]
+        if unwaitable:
+            alive += psutil.wait_procs(unwaitable, timeout=max(0.0, deadline - time.monotonic()))[1]
+        return alive
+    finally:
+        for h in handles.values():
+            _kernel32.CloseHandle(h)
+
+@dataclass
+class SystemSnapshot:
+    """One walk of the process table, shared by every lookup in a refresh tick.
+    Names are lowercased. On Windows the walk is name+pid only (Toolhelp32); Process
+    handles and cmdlines are fetched lazily, only for the pids somebody asks about."""
+    by_name: Dict[str, List[int]] = field(default_factory=dict)
+    cmdlines: Dict[int, Tuple[str, ...]] = field(default_factory=dict)
+    names: Dict[int, str] = field(default_factory=dict)
+    cmdline_lower: Dict[int, str] = field(default_factory=dict)   # " ".join(cmdline).lower()
+    exe_is_python: Dict[int, bool] = field(default_factory=dict)
+    ctimes: Dict[int, float] = field(default_factory=dict)   # portable path only (Toolhelp32 has none)
+    procs: Dict[int, psutil.Process] = field(default_factory=dict)
+    taken_at: float = 0.0
+
+    def add(self, pid: int, name: str):
+        if _watched_names is not None and name not in _watched_names:
+            return
+        self.by_name.setdefault(name, []).append(pid)
+        self.names[pid] = name
+        self.exe_is_python[pid] = 'python' in name
+
+    def get_proc(self, pid: int) -> Optional[psutil.Process]:
+        p = self.procs.get(pid)
+        if p is None and pid in self.names:
+            try:
+                p = self.procs[pid] = psutil.Process(pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                return None
+        return p
+
+    def get_cmdline(self, pid: int) -> Tuple[str, ...]:
+        cmd = self.cmdlines.get(pid)
+        if cmd is None:
+            cmd = ()
+            p = self.get_proc(pid)
+            if p is not None:
+                try:
+                    cmd = tuple(p.cmdline())
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    pass
+            self.cmdlines[pid] = cmd
+        return cmd
+
+    def get_cmdline_lower(self, pid: int) -> str:
+        joined = self.cmdline_lower.get(pid)
+        if joined is None:
+            joined = self.cmdline_lower[pid] = " ".join(self.get_cmdline(pid)).lower()
+        return joined
+
+SNAPSHOT_TTL = 0.75  # seconds a snapshot stays valid for the GUI poll
+_snapshot_cache: Optional[SystemSnapshot] = None
+# Lowercased process names worth indexing (configured apps + python); None = everything
+_watched_names: Optional[frozenset] = None
+
+def set_watched_process_names(names):
+    """Restrict snapshots to these process names (python.exe/pythonw.exe are always kept)."""
+    global _watched_names
+    _watched_names = frozenset(n.lower() for n in names if n) | _PY_EXE_NAMES
+    invalidate_system_snapshot()
+
+def _fast_proc_name_snapshot() -> Dict[int, str]:
+    """pid -> lowercased exe name via CreateToolhelp32Snapshot (Windows only).
+    Unlike process_iter this opens no process and reads no PEB."""
+    h = _kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not h or h == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        names = {}
+        ok = _kernel32.Process32FirstW(h, ctypes.byref(entry))
+        while ok:
+            names[entry.th32ProcessID] = entry.szExeFile.lower()
+            ok = _kernel32.Process32NextW(h, ctypes.byref(entry))
+        return names
+    finally:
+        _kernel32.CloseHandle(h)
+
+def _build_snapshot() -> SystemSnapshot:
+    snap = SystemSnapshot(taken_at=time.monotonic())
+    if _kernel32 is not None:
+        try:
+            for pid, nm in _fast_proc_name_snapshot().items():
+                if nm:
+                    snap.add(pid, nm)
+            return snap
+        except OSError:
+            snap = SystemSnapshot(taken_at=time.monotonic())
+    # Portable path: single process_iter pass (attrs are fetched under psutil's oneshot())
     for p in psutil.process_iter(['name', 'cmdline']):
         try:
-            nm = p.info.get('name')
-            if nm:
-                procs[nm].append(p)
+            nm = (p.info.get('name') or '').lower()
+            if not nm:
+                continue
+            snap.add(p.pid, nm)
+            if p.pid not in snap.names:
+                continue  # not a watched name
+            snap.cmdlines[p.pid] = tuple(p.info.get('cmdline') or ())
+            snap.procs[p.pid] = p
+            snap.ctimes[p.pid] = p.create_time()  # already known to psutil, no extra query
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
-    return procs
-
-def find_process(app_config: AppConfig, proc_dict: dict) -> Optional[psutil.Process]:
-    procs = proc_dict.get(app_config.process_name, [])
-    if not procs:
+    return snap
+
+def get_system_snapshot(max_age: float = SNAPSHOT_TTL) -> SystemSnapshot:
+    """Return the cached snapshot if it is younger than max_age, else rescan."""
+    global _snapshot_cache
+    snap = _snapshot_cache
+    if snap is None or time.monotonic() - snap.taken_at >= max_age:
+        snap = _snapshot_cache = _build_snapshot()
+    return snap
+
+def invalidate_system_snapshot():
+    """Drop the cached snapshot (after starting/stopping something)."""
+    global _snapshot_cache
+    _snapshot_cache = None
+
+def find_process(app_config: AppConfig, snapshot: SystemSnapshot,
+                 name_lc: Optional[str] = None) -> Optional[psutil.Process]:
+    """name_lc: the already-lowercased process_name, if the caller keeps one."""
+    pids = snapshot.by_name.get(name_lc or app_config.process_name.lower(), [])
+    if not pids:
         return None
     if app_config.script:
         target_script = app_config.script.lower()
-        for proc in procs:
-            if _match_script(proc, target_script):
-                return proc
+        for pid in pids:
+            if _match_script(snapshot, pid, target_script):
+                return snapshot.get_proc(pid)
         return None
-    return procs[0] if procs else None
+    return snapshot.get_proc(pids[0])
+
+LOG_MAX_BYTES = 16 * 1024  # trim a log once it grows past this
+LOG_KEEP_LINES = 50
+
+_ts_cache = (0, "")  # (epoch second, formatted); swapped as one tuple so threads never see a torn pair
+
+def _ts() -> str:
+    """Local 'YYYY-mm-dd HH:MM:SS', formatted at most once per second."""
+    global _ts_cache
+    now = int(time.time())
+    sec, text = _ts_cache
+    if now != sec:
+        text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        _ts_cache = (now, text)
+    return text
+
+def _rotate_log(p: Path):
+    """Trim a log file down to its last LOG_KEEP_LINES lines."""
+    lines = p.read_text(encoding="utf-8", errors="ignore").splitlines()
+    _atomic_write_bytes(p, ("\n".join(lines[-LOG_KEEP_LINES:]) + "\n").encode("utf-8"))
 
 def _log_line(app_name: str, text: str):
-    """Append a line to logs/<appname>.log and keep last 50 lines."""
+    """Append a line to logs/<appname>.log; trim to the last 50 lines once it exceeds 16 KiB."""
     try:
         _ensure_dirs()
         p = LOG_DIR / f"{app_name}.log"
-        line = f"{time.strftime('%Y-%m-%d %H:%M:%S')} | {text}\n"
-        if p.exists():
-            # keep last 49, add new one = 50
-            lines = p.read_text(encoding="utf-8", errors="ignore").splitlines()
-            lines = lines[-49:] + [line.rstrip("\n")]
-            p.write_text("\n".join(lines) + "\n", encoding="utf-8")
-        else:
-            p.write_text(line, encoding="utf-8")
+        line = f"{_ts()} | {text}\n"
+        with open(p, "a", encoding="utf-8") as f:
+            f.write(line)
+            size = f.tell()
+        if size > LOG_MAX_BYTES:
+            _rotate_log(p)
     except Exception:
         pass
 
-def start_app(app_config: AppConfig):
+def start_app(app_config: AppConfig, snapshot: Optional[SystemSnapshot] = None, report=None):
+    """Launch an app unless it is already running. Pass `snapshot` when the caller
+    already scanned the process table (e.g. starting several apps in a row).
+    `report(title, message)` shows errors; defaults to a messagebox (Tk thread only)."""
+    report = report or messagebox.showerror
     print(f"Starting {app_config.name}...")
     try:
-        proc_dict = _aggregate_proc_dict()
-        existing = find_process(app_config, proc_dict)
+        existing = find_process(app_config, snapshot or get_system_snapshot())
         if existing:
             print(f"{app_config.name} already running (pid={existing.pid}); skip start.")
             return
 
         if app_config.path and os.path.exists(app_config.path):
             subprocess.Popen([app_config.path])
+        elif isinstance(app_config.command, list):
+            subprocess.Popen(app_config.command, cwd=app_config.cwd, creationflags=subprocess.DETACHED_PROCESS)
         elif app_config.command:
+            # user-entered shell command (may use pipes, env vars, etc.)
             subprocess.Popen(app_config.command, shell=True, cwd=app_config.cwd, creationflags=subprocess.CREATE_NO_WINDOW)
         else:
-            messagebox.showerror("Error", f"No valid path or command for {app_config.name}.")
+            report("Error", f"No valid path or command for {app_config.name}.")
             return
+        invalidate_system_snapshot()
         _log_line(app_config.name, "started")
     except Exception as e:
-        messagebox.showerror("Start Error", f"Failed to start {app_config.name}:\n{e}")
+        report("Start Error", f"Failed to start {app_config.name}:\n{e}")
 
-def _match_script(proc: psutil.Process, script_name: str) -> bool:
+def _match_script(snapshot: SystemSnapshot, pid: int, script_lc: str) -> bool:
     """
-    Precise matching: Returns True ONLY if script_name is found in the 
-    command line arguments.
+    Precise matching: Returns True ONLY if the process is python and script_lc
+    (already lowercased) is found in its command line. Pure dict lookups, no psutil calls.
     """
-    try:
-        # cmdline() returns a list like ['python.exe', 'C:\\Path\\wallch.py', '--interval', '60']
-        cmd_args = proc.cmdline()
-        
-        # We convert everything to lowercase for case-insensitive comparison
-        # We verify that 'python' is likely the executable (optional, but safer)
-        exe_name = proc.name().lower()
-        
-        if 'python' not in exe_name:
-            # If it's not python, we don't check for script names (unless you wrap other languages)
-            return False
-
-        target = script_name.lower()
-        
-        # Check every argument in the command line
-        for arg in cmd_args:
-            if target in arg.lower():
-                return True
-                
-        return False
-    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-        return False
+    # Non-python processes never match a script name (unless you wrap other languages)
+    return snapshot.exe_is_python.get(pid, False) and script_lc in snapshot.get_cmdline_lower(pid)
 
 def _kill_process_tree(proc: psutil.Process):
     """
     Kills the process and all its children (essential for shell=True commands like Rclone).
     """
+    if os.name == "nt":
+        # taskkill walks the kernel's process tree natively; psutil's children() would
+        # re-enumerate every process on the system just to build a ppid map.
+        try:
+            res = subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                                 capture_output=True, timeout=5,
+                                 creationflags=subprocess.CREATE_NO_WINDOW)
+            if res.returncode == 0:
+                return
+        except (OSError, subprocess.SubprocessError):
+            pass
+        # taskkill unavailable or refused: fall back to the psutil walk below
+
     try:
         children = proc.children(recursive=True)
         for child in children:
@@ -255,7 +602,7 @@ def _kill_process_tree(proc: psutil.Process):
             except: pass
         
         # Wait briefly for children to die
-        _, alive = psutil.wait_procs(children, timeout=0.5)
+        alive = _wait_procs(children, 0.5)
         for child in alive:
             try: child.kill()
             except: pass
@@ -273,12 +620,14 @@ def stop_app(app_config: AppConfig, proc: psutil.Process):
     print(f"Stopping {app_config.name}...")
     
     targets = []
+    snap = get_system_snapshot()
+    script_lc = app_config.script.lower() if app_config.script else None
 
     # CASE A: We have a specific process object handled by the UI
     if proc and proc.is_running():
         # Double check: If it's a python script, ensure we didn't get the PIDs mixed up
         if app_config.script:
-            if _match_script(proc, app_config.script):
+            if _match_script(snap, proc.pid, script_lc):
                 targets.append(proc)
             else:
                 print(f"Warning: Stored PID {proc.pid} no longer matches script {app_config.script}. Scanning system...")
@@ -286,28 +635,22 @@ def stop_app(app_config: AppConfig, proc: psutil.Process):
         else:
             targets.append(proc)
 
-    # CASE B: We don't have a proc handle (or it was invalid), so we scan the system safely
+    # CASE B: We don't have a proc handle (or it was invalid), so we use the shared snapshot
     if not targets:
-        for p in psutil.process_iter(['pid', 'name', 'cmdline']):
-            try:
-                # 1. Check if process name matches (e.g., "pythonw.exe" or "stremio.exe")
-                if p.info['name'].lower() != app_config.process_name.lower():
+        # 1. Only processes whose name matches (e.g., "pythonw.exe" or "stremio.exe")
+        for pid in snap.by_name.get(app_config.process_name.lower(), []):
+            # 2. If it's a script, we MUST match the script name in args
+            if script_lc:
+                if not _match_script(snap, pid, script_lc):
+                    continue
+                # SPECIAL SAFETY: Don't let control.py kill itself!
+                if pid == os.getpid():
                     continue
 
-                # 2. If it's a script, we MUST match the script name in args
-                if app_config.script:
-                    if _match_script(p, app_config.script):
-                        # SPECIAL SAFETY: Don't let control.py kill itself!
-                        if p.pid == os.getpid():
-                            continue
-                        targets.append(p)
-                
-                # 3. If it's a regular app (not script), matching process name is enough
-                else:
-                    targets.append(p)
-
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+            # 3. If it's a regular app (not script), matching process name is enough
+            p = snap.get_proc(pid)
+            if p is not None:
+                targets.append(p)
 
     # Execute the Kill Order
     if not targets:
@@ -318,6 +661,7 @@ def stop_app(app_config: AppConfig, proc: psutil.Process):
     for p in targets:
         print(f"Killing PID {p.pid} ({app_config.name})")
         _kill_process_tree(p)
+    invalidate_system_snapshot()
     
     _log_line(app_config.name, "stopped")
 
@@ -325,16 +669,15 @@ def stop_app(app_config: AppConfig, proc: psutil.Process):
 # --- 2. STATE (remember last ON/OFF & autostart) + PROFILES
 # ==============================================================================
 def _load_state() -> dict:
-    try:
-        if STATE_FILE.exists():
-            return json.loads(STATE_FILE.read_text(encoding="utf-8"))
-    except Exception:
-        pass
+    _json_writer.flush(STATE_FILE)
+    data = _try_read_json(STATE_FILE, None)
+    if isinstance(data, dict):
+        return data
     return {"desired": {}, "autostart": False, "last_profile": None}
 
 def _save_state(state: dict):
     try:
-        STATE_FILE.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        _json_writer.mark(STATE_FILE, state)
     except Exception:
         pass
 
@@ -345,15 +688,15 @@ def _load_profiles() -> Dict[str, Dict[str, bool]]:
         "Chill": {"Wallpaper": true}
     }
     """
+    _json_writer.flush(PROFILES_FILE)
+    data = _try_read_json(PROFILES_FILE, None)
     try:
-        if PROFILES_FILE.exists():
-            data = json.loads(PROFILES_FILE.read_text(encoding="utf-8"))
-            if isinstance(data, dict):
-                # normalize to bools
-                for prof, mapping in data.items():
-                    for k, v in list(mapping.items()):
-                        mapping[k] = bool(v)
-                return data
+        if isinstance(data, dict):
+            # normalize to bools
+            for prof, mapping in data.items():
+                for k, v in list(mapping.items()):
+                    mapping[k] = bool(v)
+            return data
     except Exception:
         pass
     return {}  # user defines as needed
@@ -396,8 +739,10 @@ def _get_startup_enabled() -> bool:
         return False
 
 def _save_profiles(profiles: dict) -> bool:
+    """Queue profiles.json for writing; False if it can't be serialized. Write failures
+    are reported through _json_writer.on_error."""
     try:
-        PROFILES_FILE.write_text(json.dumps(profiles, indent=2), encoding="utf-8")
+        _json_writer.mark(PROFILES_FILE, profiles)
         return True
     except Exception:
         return False
@@ -405,19 +750,49 @@ def _save_profiles(profiles: dict) -> bool:
 # ==============================================================================
 # --- 3. GUI
 # ==============================================================================
+POLL_MS_VISIBLE = 2500  # status poll while the window is shown
+POLL_MS_HIDDEN = 5000   # tray-only: liveness + auto-restart, no CPU/mem stats
+POLL_MS_MAX = 15000     # idle backoff ceiling: the interval grows x1.5 per tick with no change
+POLL_BACKOFF = 1.5
+STATS_CPU_DELTA = 1.0   # percentage points / MB that count as a change worth polling fast for
+STATS_MEM_DELTA = 1.0
+# Plain 1px frames instead of themed ttk.Separators for the per-row wallch rules
+SEPARATOR_COLOR = "#444444"
+
+def _load_tray_image() -> Image.Image:
+    """Decode icon.png (or a plain fallback square) once; the tray reuses it."""
+    try:
+        with Image.open(APP_DIR / "icon.png") as im:
+            im.load()  # Image.open is lazy: decode now, not on the tray thread later
+            return im.copy()
+    except Exception:
+        return Image.new("RGBA", (64, 64), (30, 30, 30, 255))
+
+_TRAY_IMAGE = _load_tray_image()
+
+def _parse_geometry(geom: str):
+    """'WxH+X+Y' (X/Y may be negative, e.g. '+-8') -> (w, h, x, y)."""
+    size, x, y = geom.split("+", 2)
+    w, h = size.split("x")
+    return int(w), int(h), int(x), int(y)
+
 def position_dialog(dialog: tk.Toplevel, parent: tk.Tk):
     dialog.update_idletasks()
-    w, h = dialog.winfo_width(), dialog.winfo_height()
-    px, py = parent.winfo_rootx(), parent.winfo_rooty()
-    pw, ph = parent.winfo_width(), parent.winfo_height()
-    sw, sh = dialog.winfo_screenwidth(), dialog.winfo_screenheight()
-    x = max(0, min(px + (pw - w) // 2, sw - w))
-    y = max(0, min(py + (ph - h) // 2, sh - h))
-    dialog.geometry(f"+{x}+{y}")
+    w, h, _, _ = _parse_geometry(dialog.winfo_geometry())      # one Tcl call instead of two
+    pw, ph, px, py = _parse_geometry(parent.winfo_geometry())  # one Tcl call instead of four
+    sw = getattr(parent, "_screen_w", None) or dialog.winfo_screenwidth()
+    sh = getattr(parent, "_screen_h", None) or dialog.winfo_screenheight()
+    x = px + (pw - w) // 2
+    y = py + (ph - h) // 2
+    x = sw - w if x > sw - w else x
+    y = sh - h if y > sh - h else y
+    dialog.geometry(f"+{0 if x < 0 else x}+{0 if y < 0 else y}")
 
 def set_dark_title_bar(window):
     try:
-        window.update()
+        # Only idle tasks (window creation/mapping) are needed for FindWindowW to see the
+        # title; a full update() would also dispatch user input and re-enter callbacks.
+        window.update_idletasks()
         hwnd = ctypes.windll.user32.FindWindowW(None, window.title())
         if hwnd:
             value = ctypes.c_int(1)
@@ -432,9 +807,10 @@ class WallpaperSettingsDialog(tk.Toplevel):
         self.transient(parent)
         self.resizable(False, False)
         self.grab_set()
-        self.var_folder = tk.StringVar(value=current_settings["folder"])
-        self.var_interval = tk.IntVar(value=current_settings["interval"])
-        self.var_style = tk.StringVar(value=current_settings["style"])
+        # Fingerprint of what was shown, so an unchanged Save skips the write and the restart
+        self._orig_hash = self._settings_hash(current_settings)
+        # Text fields are read straight from their widgets; only the checkbuttons keep
+        # variables (a ttk.Checkbutton creates a Tcl variable of its own without one)
         self.var_shuffle = tk.BooleanVar(value=current_settings["shuffle"])
         self.var_recursive = tk.BooleanVar(value=current_settings["recursive"])
         self.var_once = tk.BooleanVar(value=current_settings["once"])
@@ -443,12 +819,18 @@ class WallpaperSettingsDialog(tk.Toplevel):
         ttk.Label(frm, text="Folder:", font="-weight bold").grid(row=0, column=0, sticky="w", pady=(0, 6))
         row1 = ttk.Frame(frm)
         row1.grid(row=1, column=0, columnspan=3, sticky="ew", pady=(0,10)); row1.columnconfigure(0, weight=1)
-        ttk.Entry(row1, textvariable=self.var_folder).grid(row=0, column=0, sticky="ew", padx=(0,8))
+        self.ent_folder = ttk.Entry(row1)
+        self.ent_folder.insert(0, current_settings["folder"])
+        self.ent_folder.grid(row=0, column=0, sticky="ew", padx=(0,8))
         ttk.Button(row1, text="Browse…", command=self.browse_folder, bootstyle=SECONDARY).grid(row=0, column=1)
         ttk.Label(frm, text="Interval (seconds):", font="-weight bold").grid(row=2, column=0, sticky="w")
-        ttk.Spinbox(frm, from_=1, to=86400, textvariable=self.var_interval, width=12).grid(row=3, column=0, sticky="w", pady=(0,10))
+        self.spn_interval = ttk.Spinbox(frm, from_=1, to=86400, width=12)
+        self.spn_interval.set(current_settings["interval"])
+        self.spn_interval.grid(row=3, column=0, sticky="w", pady=(0,10))
         ttk.Label(frm, text="Style:", font="-weight bold").grid(row=4, column=0, sticky="w")
-        ttk.Combobox(frm, state="readonly", textvariable=self.var_style, values=["fill","fit","stretch","center","tile","span"], width=12).grid(row=5, column=0, sticky="w", pady=(0,10))
+        self.cmb_style = ttk.Combobox(frm, state="readonly", values=["fill","fit","stretch","center","tile","span"], width=12)
+        self.cmb_style.set(current_settings["style"])
+        self.cmb_style.grid(row=5, column=0, sticky="w", pady=(0,10))
         chk_row = ttk.Frame(frm)
         chk_row.grid(row=6, column=0, columnspan=3, sticky="w", pady=(0,10))
         ttk.Checkbutton(chk_row, text="Shuffle", variable=self.var_shuffle, bootstyle="success").pack(side=tk.LEFT, padx=(0,16))
@@ -460,24 +842,37 @@ class WallpaperSettingsDialog(tk.Toplevel):
         ttk.Button(btns, text="Save & Apply", command=lambda: self.save(app_config, apply_now=True), bootstyle=SUCCESS).pack(side=tk.RIGHT)
         position_dialog(self, parent)
 
+    @staticmethod
+    def _settings_hash(settings: dict) -> int:
+        return hash(tuple((k, settings.get(k)) for k in DEFAULT_WALLCH_SETTINGS))
+
     def browse_folder(self):
-        folder = filedialog.askdirectory(initialdir=self.var_folder.get() or str(APP_DIR))
-        if folder: self.var_folder.set(folder)
+        folder = filedialog.askdirectory(initialdir=self.ent_folder.get() or str(APP_DIR))
+        if folder:
+            self.ent_folder.delete(0, tk.END); self.ent_folder.insert(0, folder)
 
     def save(self, app_config, apply_now=False):
-        settings = {"folder": self.var_folder.get().strip(), "interval": self.var_interval.get(), "style": self.var_style.get(), "shuffle": self.var_shuffle.get(), "recursive": self.var_recursive.get(), "once": self.var_once.get()}
+        try:
+            interval = int(self.spn_interval.get())
+        except ValueError:
+            messagebox.showerror("Invalid interval", "Interval must be a whole number of seconds.", parent=self); return
+        settings = {"folder": self.ent_folder.get().strip(), "interval": interval, "style": self.cmb_style.get(), "shuffle": self.var_shuffle.get(), "recursive": self.var_recursive.get(), "once": self.var_once.get()}
         if not settings["folder"] or not os.path.isdir(settings["folder"]):
             messagebox.showerror("Invalid folder", "Please choose a valid folder.", parent=self); return
-        save_wallch_settings(settings)
-        app_config.command = build_wallch_command(settings)
+        unchanged = self._settings_hash(settings) == self._orig_hash
+        if not unchanged:
+            save_wallch_settings(settings)
+            app_config.command = build_wallch_command(settings)
         if apply_now:
-            proc_dict = _aggregate_proc_dict()
-            proc = find_process(app_config, proc_dict)
-            if proc:
+            snap = get_system_snapshot()
+            proc = find_process(app_config, snap)
+            if proc and unchanged:
+                pass  # already running with these exact arguments
+            elif proc:
                 stop_app(app_config, proc)
                 self.after(500, lambda: start_app(app_config))
             else:
-                start_app(app_config)
+                start_app(app_config, snap)
         self.destroy()
 
 class ProfilesManagerDialog(tk.Toplevel):
@@ -504,41 +899,36 @@ class ProfilesManagerDialog(tk.Toplevel):
         # Left: profiles list + buttons
         left = ttk.Frame(outer)
         left.grid(row=1, column=0, sticky="nsw", padx=(0,12))
-        self.lb = tk.Listbox(left, height=14)
+        # iid == profile name, so the selection maps straight onto self.profiles keys
+        self.lb = ttk.Treeview(left, show="tree", selectmode="browse", height=14)
         self.lb.pack(fill=tk.BOTH, expand=True)
-        self.lb.configure(exportselection=False)  # keep selection even when focus moves
         self.current_profile: str | None = None   # sticky selection
         btns = ttk.Frame(left); btns.pack(fill=tk.X, pady=(8,0))
         ttk.Button(btns, text="Add", command=self._add_profile, bootstyle=SUCCESS).pack(side=tk.LEFT)
         ttk.Button(btns, text="Rename", command=self._rename_profile, bootstyle=INFO).pack(side=tk.LEFT, padx=6)
         ttk.Button(btns, text="Delete", command=self._delete_profile, bootstyle=DANGER).pack(side=tk.LEFT)
 
-        # Right: scrollable area with per-app comboboxes
+        # Right: one Treeview, one row per app; the "mode" column cycles Leave/Start/Stop
         right = ttk.Frame(outer)
         right.grid(row=1, column=1, sticky="nsew")
         right.rowconfigure(0, weight=1); right.columnconfigure(0, weight=1)
 
-        self.canvas = tk.Canvas(right, borderwidth=0, highlightthickness=0)
-        self.sframe = ttk.Frame(self.canvas)
-        self.swin = self.canvas.create_window((0,0), window=self.sframe, anchor="nw")
-        sc = ttk.Scrollbar(right, orient="vertical", command=self.canvas.yview)
-        self.canvas.configure(yscrollcommand=sc.set)
-        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.tree = ttk.Treeview(right, columns=("mode",), show="tree headings", selectmode="browse")
+        self.tree.heading("#0", text="App", anchor="w")
+        self.tree.heading("mode", text="Action", anchor="w")
+        self.tree.column("mode", width=90, stretch=False)
+        sc = ttk.Scrollbar(right, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=sc.set)
+        self.tree.grid(row=0, column=0, sticky="nsew")
         sc.grid(row=0, column=1, sticky="ns")
+        ttk.Label(right, text="Double-click or press Space to change an app's action.", font="-size 9").grid(row=1, column=0, columnspan=2, sticky="w", pady=(4,0))
 
-        self.sframe.bind("<Configure>", lambda e: (self.canvas.configure(scrollregion=self.canvas.bbox("all")),
-                                                   self.canvas.itemconfig(self.swin, width=self.canvas.winfo_width())))
-        self.canvas.bind("<Configure>", lambda e: self.canvas.itemconfig(self.swin, width=e.width))
-
-        # Per-app controls: app -> tk.StringVar("Leave"/"Start"/"Stop")
-        self.app_modes: dict[str, tk.StringVar] = {}
+        # iid == app name, so modes are read/written with tree.set(app, "mode")
         for app in self.apps:
-            row = ttk.Frame(self.sframe); row.pack(fill=tk.X, pady=2)
-            ttk.Label(row, text=app).pack(side=tk.LEFT)
-            var = tk.StringVar(value="Leave")
-            cb = ttk.Combobox(row, state="readonly", width=8, textvariable=var, values=["Leave","Start","Stop"])
-            cb.pack(side=tk.RIGHT)
-            self.app_modes[app] = var
+            if not self.tree.exists(app):
+                self.tree.insert("", "end", iid=app, text=app, values=("Leave",))
+        self.tree.bind("<Double-1>", self._on_tree_double_click)
+        self.tree.bind("<space>", lambda e: self._cycle_mode(self.tree.focus()))
 
         # Footer buttons
         footer = ttk.Frame(outer); footer.grid(row=2, column=0, columnspan=2, sticky="e", pady=(10,0))
@@ -547,32 +937,54 @@ class ProfilesManagerDialog(tk.Toplevel):
 
         # Load initial profiles
         for name in sorted(self.profiles.keys()):
-            self.lb.insert(tk.END, name)
-        self.lb.bind("<<ListboxSelect>>", lambda e: self._load_selected())
-        if self.lb.size() > 0:
-            self.lb.selection_set(0)
-            self._load_selected()
+            self.lb.insert("", "end", iid=name, text=name)
+        self.lb.bind("<<TreeviewSelect>>", lambda e: self._load_selected())
+        self._select_profile(next(iter(self.lb.get_children()), None))
 
-        self.update_idletasks()
-        self.minsize(560, 460)
-        position_dialog(self, parent)
+        self.minsize(560, 460)          # literal size; needs no realized geometry
+        position_dialog(self, parent)   # does the single update_idletasks for this dialog
 
     # Helpers
+    _MODES = ("Leave", "Start", "Stop")
+
+    def _app_rows(self):
+        return self.tree.get_children()
+
+    def _cycle_mode(self, iid: str):
+        if not iid:
+            return "break"
+        mode = self.tree.set(iid, "mode")
+        nxt = self._MODES[(self._MODES.index(mode) + 1) % len(self._MODES)] if mode in self._MODES else "Leave"
+        self.tree.set(iid, "mode", nxt)
+        return "break"
+
+    def _on_tree_double_click(self, event):
+        return self._cycle_mode(self.tree.identify_row(event.y))
+
+    def _select_profile(self, name: Optional[str]):
+        if name is not None:
+            self.lb.selection_set(name)
+            self.lb.focus(name); self.lb.see(name)
+        self._load_selected()
+
+    def _selected_profile(self) -> Optional[str]:
+        sel = self.lb.selection()
+        return sel[0] if sel else None
+
     def _load_selected(self):
-        sel = self.lb.curselection()
-        if not sel:
+        name = self._selected_profile()
+        if name is None:
             self.current_profile = None
-            for v in self.app_modes.values(): 
-                v.set("Leave")
+            for app in self._app_rows():
+                self.tree.set(app, "mode", "Leave")
             return
-        name = self.lb.get(sel[0])
         self.current_profile = name
         mapping = self.profiles.get(name, {})
-        for app, var in self.app_modes.items():
+        for app in self._app_rows():
             if app in mapping:
-                var.set("Start" if mapping[app] else "Stop")
+                self.tree.set(app, "mode", "Start" if mapping[app] else "Stop")
             else:
-                var.set("Leave")
+                self.tree.set(app, "mode", "Leave")
 
     def _commit_current_to_profiles(self):
         name = self.current_profile
@@ -580,8 +992,8 @@ class ProfilesManagerDialog(tk.Toplevel):
             return
         # Only store entries that are Start or Stop; omit Leave
         mapping = {}
-        for app, var in self.app_modes.items():
-            mode = var.get()
+        for app in self._app_rows():
+            mode = self.tree.set(app, "mode")
             if mode == "Start":
                 mapping[app] = True
             elif mode == "Stop":
@@ -598,17 +1010,13 @@ class ProfilesManagerDialog(tk.Toplevel):
             messagebox.showerror("Exists", f"Profile '{name}' already exists.", parent=self); return
         self._commit_current_to_profiles()  # save edits of previous profile
         self.profiles[name] = {}
-        self.lb.insert(tk.END, name)
-        self.lb.selection_clear(0, tk.END)
-        self.lb.selection_set(tk.END)
-        self.current_profile = name          # <-- keep sticky
-        self._load_selected()
+        self.lb.insert("", "end", iid=name, text=name)
+        self._select_profile(name)           # <-- keeps current_profile sticky
 
 
     def _rename_profile(self):
-        sel = self.lb.curselection()
-        if not sel: return
-        old = self.lb.get(sel[0])
+        old = self._selected_profile()
+        if old is None: return
         new = simpledialog.askstring("Rename Profile", "New name:", initialvalue=old, parent=self)
         if not new: return
         new = new.strip()
@@ -617,24 +1025,17 @@ class ProfilesManagerDialog(tk.Toplevel):
             messagebox.showerror("Exists", f"Profile '{new}' already exists.", parent=self); return
         self._commit_current_to_profiles()
         self.profiles[new] = self.profiles.pop(old)
-        self.lb.delete(sel[0]); self.lb.insert(sel[0], new); self.lb.selection_set(sel[0])
-        self.current_profile = new           # <-- keep sticky
-        self._load_selected()
+        self.lb.insert("", self.lb.index(old), iid=new, text=new); self.lb.delete(old)
+        self._select_profile(new)            # <-- keeps current_profile sticky
 
     def _delete_profile(self):
-        sel = self.lb.curselection()
-        if not sel: return
-        name = self.lb.get(sel[0])
+        name = self._selected_profile()
+        if name is None: return
         if not messagebox.askyesno("Delete", f"Delete profile '{name}'?", parent=self):
             return
         self.profiles.pop(name, None)
-        self.lb.delete(sel[0])
-        if self.lb.size() == 0:
-            self.current_profile = None
-            for v in self.app_modes.values(): v.set("Leave")
-        else:
-            self.lb.selection_set(0)
-            self._load_selected()
+        self.lb.delete(name)
+        self._select_profile(next(iter(self.lb.get_children()), None))
 
 
     def _save(self):
@@ -651,14 +1052,23 @@ class AddEditAppDialog(tk.Toplevel):
         self.resizable(False, False)
         self.result: Optional[AppConfig] = None
 
-        self.vars = {
-            "name": tk.StringVar(value=app_to_edit.name if app_to_edit else ""),
-            "process_name": tk.StringVar(value=app_to_edit.process_name if app_to_edit else ""),
-            "path": tk.StringVar(value=app_to_edit.path if app_to_edit else ""),
-            "command": tk.StringVar(value=app_to_edit.command if app_to_edit else ""),
-            "cwd": tk.StringVar(value=app_to_edit.cwd if app_to_edit else ""),
-            "script": tk.StringVar(value=app_to_edit.script if app_to_edit else "")
+        command = app_to_edit.command if app_to_edit else ""
+        if isinstance(command, list):
+            command = subprocess.list2cmdline(command)
+        # Initial field values; the Entry widgets themselves hold the text (no Tk variables)
+        initial = {
+            "name": app_to_edit.name if app_to_edit else "",
+            "process_name": app_to_edit.process_name if app_to_edit else "",
+            "path": app_to_edit.path if app_to_edit else "",
+            "command": command,
+            "cwd": app_to_edit.cwd if app_to_edit else "",
+            "script": app_to_edit.script if app_to_edit else ""
         }
+        self.entries: Dict[str, ttk.Entry] = {}
+        def entry(master, key):
+            e = self.entries[key] = ttk.Entry(master)
+            e.insert(0, initial[key] or "")
+            return e
 
         frm = ttk.Frame(self, padding=20)
         frm.grid(row=0, column=0, sticky="nsew")
@@ -667,28 +1077,28 @@ class AddEditAppDialog(tk.Toplevel):
         info_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
         info_frame.columnconfigure(1, weight=1)
         ttk.Label(info_frame, text="App Name:").grid(row=0, column=0, sticky="w", padx=(0,10), pady=2)
-        ttk.Entry(info_frame, textvariable=self.vars["name"]).grid(row=0, column=1, sticky="ew")
+        entry(info_frame, "name").grid(row=0, column=1, sticky="ew")
         ttk.Label(info_frame, text="Process Name:").grid(row=1, column=0, sticky="w", padx=(0,10), pady=2)
-        ttk.Entry(info_frame, textvariable=self.vars["process_name"]).grid(row=1, column=1, sticky="ew")
+        entry(info_frame, "process_name").grid(row=1, column=1, sticky="ew")
 
         launch_frame = ttk.Labelframe(frm, text="2. Launch Method (Choose one)", padding=15)
         launch_frame.grid(row=1, column=0, sticky="ew", pady=(0, 10))
         launch_frame.columnconfigure(0, weight=1)
         ttk.Label(launch_frame, text="Executable Path:").grid(row=0, column=0, columnspan=2, sticky="w", pady=(0,5))
-        path_entry = ttk.Entry(launch_frame, textvariable=self.vars["path"])
+        path_entry = entry(launch_frame, "path")
         path_entry.grid(row=1, column=0, sticky="ew", padx=(0,5))
         ttk.Button(launch_frame, text="Browse...", command=self.browse_path).grid(row=1, column=1, sticky="e")
         ttk.Separator(launch_frame, orient="horizontal").grid(row=2, column=0, columnspan=2, sticky="ew", pady=10)
         ttk.Label(launch_frame, text="Or Shell Command:").grid(row=3, column=0, columnspan=2, sticky="w", pady=(0,5))
-        ttk.Entry(launch_frame, textvariable=self.vars["command"]).grid(row=4, column=0, columnspan=2, sticky="ew")
+        entry(launch_frame, "command").grid(row=4, column=0, columnspan=2, sticky="ew")
 
         adv_frame = ttk.Labelframe(frm, text="3. Advanced (Optional)", padding=15)
         adv_frame.grid(row=2, column=0, sticky="ew")
         adv_frame.columnconfigure(1, weight=1)
         ttk.Label(adv_frame, text="Working Dir (CWD):").grid(row=0, column=0, sticky="w", padx=(0,10), pady=2)
-        ttk.Entry(adv_frame, textvariable=self.vars["cwd"]).grid(row=0, column=1, sticky="ew")
+        entry(adv_frame, "cwd").grid(row=0, column=1, sticky="ew")
         ttk.Label(adv_frame, text="Python Script Name:").grid(row=1, column=0, sticky="w", padx=(0,10), pady=2)
-        ttk.Entry(adv_frame, textvariable=self.vars["script"]).grid(row=1, column=1, sticky="ew")
+        entry(adv_frame, "script").grid(row=1, column=1, sticky="ew")
 
         btn_bar = ttk.Frame(frm, padding=(0, 15, 0, 0))
         btn_bar.grid(row=3, column=0, sticky="e")
@@ -704,16 +1114,21 @@ class AddEditAppDialog(tk.Toplevel):
             filetypes=[("Executables", "*.exe"), ("All files", "*.*")]
         )
         if path:
-            self.vars["path"].set(path)
+            self._set_text("path", path)
             # If process name empty, infer from filename
-            if not self.vars["process_name"].get().strip():
-                self.vars["process_name"].set(os.path.basename(path))
+            if not self.entries["process_name"].get().strip():
+                self._set_text("process_name", os.path.basename(path))
+
+    def _set_text(self, key: str, text: str):
+        e = self.entries[key]
+        e.delete(0, tk.END)
+        e.insert(0, text)
 
     def save(self):
-        name = self.vars["name"].get().strip()
-        proc_name = self.vars["process_name"].get().strip()
-        path = self.vars["path"].get().strip()
-        command = self.vars["command"].get().strip()
+        name = self.entries["name"].get().strip()
+        proc_name = self.entries["process_name"].get().strip()
+        path = self.entries["path"].get().strip()
+        command = self.entries["command"].get().strip()
         if not name or not proc_name:
             messagebox.showerror("Missing Info", "App Name and Process Name are required.", parent=self); return
         if not path and not command:
@@ -723,7 +1138,7 @@ class AddEditAppDialog(tk.Toplevel):
             command = ""
 
         # ✅ generic, app-agnostic
-        script_val = self.vars["script"].get().strip()
+        script_val = self.entries["script"].get().strip()
         if script_val:
             app_type = "python-script"
         elif path:
@@ -736,7 +1151,7 @@ class AddEditAppDialog(tk.Toplevel):
         self.result = AppConfig(
             name=name, process_name=proc_name,
             path=path or None, command=command or None,
-            cwd=self.vars["cwd"].get().strip() or None,
+            cwd=self.entries["cwd"].get().strip() or None,
             script=script_val or None,
             type=app_type
         )
@@ -744,6 +1159,8 @@ class AddEditAppDialog(tk.Toplevel):
 
 
 class ScrollableFrame(ttk.Frame):
+    _BG_COLOR_CACHE: Dict[str, str] = {}  # theme name -> TFrame background
+
     def __init__(self, parent, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
         self.grid_rowconfigure(0, weight=1)
@@ -754,6 +1171,9 @@ class ScrollableFrame(ttk.Frame):
         self.canvas_frame = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
         self.canvas.grid(row=0, column=0, sticky="nsew")
+        self._scroll_after = None  # pending after_idle id for _apply_scroll
+        self._wheel_after = None   # pending after_idle id for _apply_wheel
+        self._wheel_units = 0
         self.scrollable_frame.bind("<Configure>", self.on_frame_configure)
         self.canvas.bind('<Configure>', self.on_canvas_configure)
         self.canvas.bind("<Enter>", lambda e: self.canvas.bind_all("<MouseWheel>", self._on_mousewheel))
@@ -762,12 +1182,15 @@ class ScrollableFrame(ttk.Frame):
     def _get_bg_color(self):
         try:
             style = ttk.Style()
-            return style.lookup('TFrame', 'background')
+            theme = style.theme_use()
+            color = self._BG_COLOR_CACHE.get(theme)
+            if color is None:
+                color = self._BG_COLOR_CACHE[theme] = style.lookup('TFrame', 'background')
+            return color
         except:
             return "#2C2C2C"
 
     def update_scrollbar(self):
-        self.update_idletasks()
         content_height = self.scrollable_frame.winfo_reqheight()
         canvas_height = self.canvas.winfo_height()
         if content_height > canvas_height:
@@ -775,44 +1198,74 @@ class ScrollableFrame(ttk.Frame):
         else:
             self.scrollbar.grid_forget()
 
-    def on_frame_configure(self, event):
+    def _schedule_scroll_update(self):
+        # A burst of child <Configure> events collapses into one pass per idle tick
+        if self._scroll_after is None:
+            self._scroll_after = self.after_idle(self._apply_scroll)
+
+    def _apply_scroll(self):
+        self._scroll_after = None
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
         self.update_scrollbar()
 
+    def on_frame_configure(self, event):
+        self._schedule_scroll_update()
+
     def on_canvas_configure(self, event):
         self.canvas.itemconfig(self.canvas_frame, width=event.width)
-        self.update_scrollbar()
+        self._schedule_scroll_update()
 
     def _on_mousewheel(self, event):
-        widget_under_cursor = self.winfo_containing(event.x_root, event.y_root)
-        if widget_under_cursor and self.canvas in widget_under_cursor.winfo_parents() or widget_under_cursor == self.canvas:
-            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        # <MouseWheel> is only bound while the pointer is over the canvas (see <Enter>/<Leave>),
+        # so no hit-test is needed. Ticks are summed and applied once per idle pass.
+        self._wheel_units += int(-1 * (event.delta / 120))
+        if self._wheel_after is None:
+            self._wheel_after = self.after_idle(self._apply_wheel)
+
+    def _apply_wheel(self):
+        self._wheel_after = None
+        units, self._wheel_units = self._wheel_units, 0
+        if units:
+            self.canvas.yview_scroll(units, "units")
 
     def destroy(self):
+        if self._scroll_after is not None:
+            self.after_cancel(self._scroll_after)
+            self._scroll_after = None
+        if self._wheel_after is not None:
+            self.after_cancel(self._wheel_after)
+            self._wheel_after = None
         self.unbind_all("<MouseWheel>")
         super().destroy()
 
 class DraggableAppFrame(ttk.Frame):
+    _DRAG_EVENTS = ("<ButtonPress-1>", "<B1-Motion>", "<ButtonRelease-1>")
+
     def __init__(self, parent, app_manager, app_config, index, **kwargs):
         super().__init__(parent, **kwargs)
         self.app_manager = app_manager
         self.app_config = app_config
         self.index = index
+        # One bind tag carries the drag handlers for the frame and all of its descendants
+        self._drag_tag = f"drag{id(self)}"
+        for seq, handler in zip(self._DRAG_EVENTS, (self.on_press, self.on_motion, self.on_release)):
+            self.bind_class(self._drag_tag, seq, handler)
         self.bind_events()
 
     def bind_events(self):
-        self.bind("<ButtonPress-1>", self.on_press)
-        self.bind("<B1-Motion>", self.on_motion)
-        self.bind("<ButtonRelease-1>", self.on_release)
-        for widget in self.winfo_children():
-            self._bind_recursive(widget)
-
-    def _bind_recursive(self, widget):
-        widget.bind("<ButtonPress-1>", self.on_press)
-        widget.bind("<B1-Motion>", self.on_motion)
-        widget.bind("<ButtonRelease-1>", self.on_release)
-        for child in widget.winfo_children():
-            self._bind_recursive(child)
+        """Append the drag tag to this frame and every descendant (call again after adding children)."""
+        pending = deque([self])
+        while pending:
+            widget = pending.popleft()
+            tags = widget.bindtags()
+            if self._drag_tag not in tags:
+                widget.bindtags(tags + (self._drag_tag,))
+            pending.extend(widget.winfo_children())
+
+    def destroy(self):
+        for seq in self._DRAG_EVENTS:
+            self.unbind_class(self._drag_tag, seq)
+        super().destroy()
 
     def on_press(self, event):
         self.app_manager.start_drag(self.index, self)
@@ -828,45 +1281,113 @@ class AppManager(ttk.Window):
         super().__init__(themename="darkly")
         self.title("The Control")
         set_dark_title_bar(self)
-        _ensure_dirs()
+        # Screen size doesn't change under us; position_dialog reads these instead of asking Tk
+        self._screen_w, self._screen_h = self.winfo_screenwidth(), self.winfo_screenheight()
 
         self.geometry("450x700"); self.resizable(True, True)
-        self.apps: List[AppConfig] = load_apps_from_json()
+        self.withdraw()  # hidden until the config is loaded; only the first run shows it
 
-        # Desired ON/OFF map (remembered & for autorestart)
-        self.app_state = _load_state()
-        self.desired: Dict[str, bool] = dict(self.app_state.get("desired", {}))
-        # Profiles
-        self.profiles = _load_profiles()
-        # Autostart sync
-        if _get_startup_enabled() != bool(self.app_state.get("autostart", False)):
-            _set_startup_enabled(bool(self.app_state.get("autostart", False)))
+        # Filled by _finish_init once the worker thread has read the config files
+        self.apps: List[AppConfig] = []
+        self.app_state: dict = {}
+        self.desired: Dict[str, bool] = {}   # Desired ON/OFF map (remembered & for autorestart)
+        self.profiles: Dict[str, Dict[str, bool]] = {}
 
         self.ui_elements = {}
+        self._visible = False    # maintained by show_window/hide_window (no Tcl state() query)
+        self._work_area = None   # cached SPI_GETWORKAREA rect, see position_window
         self.tray_icon = None
         self.after_id = None
+        self._proc_name_lc: Dict[str, str] = {}   # app name -> lowercased process_name, see _reindex_apps
+        self._apps_by_script: Dict[str, AppConfig] = {}  # script -> first app running it
+        self._poll_interval: Optional[int] = None  # current adaptive poll delay; None = base rate
+        self._tray_refresh_id = None  # pending after() for refresh_tray_menu
+        self._tray_menu_key = None    # sorted profile names the current tray menu was built from
 
         self.drag_source_index = None
         self.drag_target_index = None
         self.drag_placeholder = None
+        self._drag_pending = False
+        self._drag_pos = None
+        self._drag_frames: Dict[str, DraggableAppFrame] = {}
+        self._controls_frame = None   # ScrollableFrame, built once by _build_static_ui
+        self._content_area = None
+        self._row_order: List[str] = []
 
         self.main_frame = ttk.Frame(self, padding=20)
         self.main_frame.pack(expand=True, fill=tk.BOTH)
+        self.protocol("WM_DELETE_WINDOW", self.hide_window)
+        _json_writer.on_error = self._report_save_error
+
+        # Read apps/state/profiles off the Tk thread; _await_bulk_load picks the result up
+        self._bulk_result = None
+        threading.Thread(target=self._bulk_load, daemon=True).start()
+        self._await_bulk_load()
+
+    def _bulk_load(self):
+        """Worker thread: read every config file (and the autostart registry value). No Tk calls.
+        Always publishes a result: each failed read falls back to its default and its error
+        is handed to _finish_init, which shows it on the Tk thread."""
+        errors: List[Tuple[str, Exception]] = []
+
+        def attempt(label, fn, default):
+            try:
+                return fn()
+            except Exception as e:
+                errors.append((label, e))
+                return default
+
+        attempt("the config folders", _ensure_dirs, None)
+        apps = attempt("'apps.json'", load_apps_from_json, [])
+        state = attempt("'control.state.json'", _load_state, {"desired": {}, "autostart": False, "last_profile": None})
+        profiles = attempt("'profiles.json'", _load_profiles, {})
+        # on failure assume the registry already matches, so no sync is attempted
+        startup_enabled = attempt("the autostart setting", _get_startup_enabled,
+                                  bool(state.get("autostart", False)))
+        first_run = attempt("'control.state.json'", lambda: not STATE_FILE.exists(), False)
+        self._bulk_result = (apps, errors, state, profiles, startup_enabled, first_run)
+
+    def _report_save_error(self, path: Path, err: Exception):
+        """_json_writer error hook (may run on its timer thread): show the error on the Tk thread."""
+        try:
+            self.after(0, messagebox.showerror, "Save Error", f"Could not save '{path.name}':\n{err}")
+        except Exception:
+            pass
+
+    def _reindex_apps(self):
+        """Refresh the lookups derived from self.apps; call whenever self.apps changes."""
+        self._proc_name_lc = {a.name: a.process_name.lower() for a in self.apps}
+        self._apps_by_script = {a.script: a for a in reversed(self.apps) if a.script}  # first one wins
+        set_watched_process_names(self._proc_name_lc.values())
+
+    def _await_bulk_load(self):
+        if self._bulk_result is None:
+            self.after(10, self._await_bulk_load)
+            return
+        self._finish_init(*self._bulk_result)
+
+    def _finish_init(self, apps, errors, state, profiles, startup_enabled, first_run):
+        if errors:
+            messagebox.showerror("Config Error", "\n\n".join(f"Failed to load {label}:\n{e}" for label, e in errors))
+        self.apps = apps
+        self._reindex_apps()
+        self.app_state = state
+        self.desired = dict(self.app_state.get("desired", {}))
+        self.profiles = profiles
+        # Autostart sync
+        if startup_enabled != bool(self.app_state.get("autostart", False)):
+            _set_startup_enabled(bool(self.app_state.get("autostart", False)))
 
         self.rebuild_ui()
         self.setup_tray_icon()
-        self.protocol("WM_DELETE_WINDOW", self.hide_window)
 
         # Apply remembered state on launch
         self.after(50, self.apply_desired_on_launch)
-        self.after(250, self.update_statuses)
+        self._schedule_statuses(250)
 
-        first_run = not STATE_FILE.exists()
         if first_run:
             # show once on first run, after widgets have measured their size
             self.after(120, self.show_window)
-        else:
-            self.withdraw()
     
     def open_profiles_manager(self):
         app_names = [a.name for a in self.apps]
@@ -875,29 +1396,33 @@ class AppManager(ttk.Window):
         if dlg.result is not None:
             self.profiles = dlg.result
             _save_profiles(self.profiles)
-            self.refresh_tray_menu()
+            self._request_tray_refresh()
 
     def apply_desired_on_launch(self):
+        if not _single_instance_ready.is_set():
+            # an older instance may still own the apps; retry once it has been killed
+            self.after(100, self.apply_desired_on_launch)
+            return
+        snap = get_system_snapshot()  # one scan for all launches
         for app in self.apps:
             want = self.desired.get(app.name, False)
             if want:
-                start_app(app)
-        self.update_statuses()
+                start_app(app, snap)
+        self._schedule_statuses(0)
 
     def position_window(self):
         self.update_idletasks()
         width, height = self.winfo_width(), self.winfo_height()
-        work_area = wintypes.RECT()
-        ctypes.windll.user32.SystemParametersInfoW(0x0030, 0, ctypes.byref(work_area), 0)
+        work_area = self._work_area
+        if work_area is None:
+            # SPI_GETWORKAREA; re-read each time the window is shown (taskbar may have moved)
+            work_area = self._work_area = wintypes.RECT()
+            ctypes.windll.user32.SystemParametersInfoW(0x0030, 0, ctypes.byref(work_area), 0)
         x = work_area.right - width - 20
         y = work_area.bottom - height - 30
         self.geometry(f'+{x}+{y}')
 
-    def rebuild_ui(self):
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
-        self.ui_elements.clear()
-
+    def _build_static_ui(self):
         header_frame = ttk.Frame(self.main_frame)
         header_frame.pack(fill=tk.X, pady=(0, 10))
         ttk.Label(header_frame, text="Application Status", font="-size 16 -weight bold", bootstyle=PRIMARY).pack(side=tk.LEFT)
@@ -907,43 +1432,94 @@ class AppManager(ttk.Window):
         ttk.Button(btn_bar, text="Manage Profiles", command=self.open_profiles_manager, bootstyle=SECONDARY).pack(side=tk.RIGHT, padx=(8,0))
         ttk.Button(btn_bar, text="Manage Apps", command=self.open_app_manager, bootstyle=INFO).pack(side=tk.RIGHT)
 
-        controls_frame = ScrollableFrame(self.main_frame)
-        controls_frame.pack(expand=True, fill=tk.BOTH)
-        content_area = controls_frame.scrollable_frame
-
-        self.drag_placeholder = ttk.Frame(content_area, height=6, bootstyle='info')
-
-        for i, app_config in enumerate(self.apps):
-            app_frame = DraggableAppFrame(content_area, self, app_config, i, padding=(10, 8))
-            app_frame.pack(fill=tk.X)
-
-            info_frame = ttk.Frame(app_frame)
-            info_frame.pack(side=tk.LEFT, expand=True, fill=tk.X)
-            name_lbl = ttk.Label(info_frame, text=app_config.name, font="-size 12")
-            name_lbl.pack(side=tk.LEFT, anchor="w")
-            stats_lbl = ttk.Label(info_frame, text="", font="-size 9", bootstyle=INFO)
-            stats_lbl.pack(side=tk.RIGHT, anchor="e", padx=10)
-            switch = ttk.Checkbutton(app_frame, bootstyle="success,round-toggle",
-                                     command=lambda cfg=app_config: self.toggle_app(cfg))
-            switch.pack(side=tk.RIGHT, anchor="e")
-
-            self.ui_elements[app_config.name] = {'switch': switch, 'stats_lbl': stats_lbl, 'proc': None, 'frame': app_frame}
-            app_frame.bind_events()
-
-            if app_config.script == 'wallch.py':
-                ttk.Separator(content_area, orient='horizontal').pack(fill=tk.X, pady=(5, 10))
-                btn_bar = ttk.Frame(content_area)
-                btn_bar.pack(fill=tk.X, pady=(0, 10))
-                btn_settings = ttk.Button(btn_bar, text="⚙", command=lambda cfg=app_config: self.open_wallpaper_settings(cfg), bootstyle=SECONDARY)
-                btn_settings.pack(side=tk.LEFT, padx=10)
-                btn_toggle = ttk.Button(btn_bar, text="▶", command=self.wallch_toggle, bootstyle=INFO)
-                btn_toggle.pack(side=tk.LEFT, padx=6)
-                btn_next = ttk.Button(btn_bar, text="⏭", command=self.wallch_next, bootstyle=SUCCESS)
-                btn_next.pack(side=tk.LEFT, padx=6)
-                self.ui_elements[app_config.name].update({'btn_toggle': btn_toggle, 'btn_next': btn_next})
-                ttk.Separator(content_area, orient='horizontal').pack(fill=tk.X, pady=5)
-
-        if tk.Tk.state(self) == "normal":
+        self._controls_frame = ScrollableFrame(self.main_frame)
+        self._controls_frame.pack(expand=True, fill=tk.BOTH)
+        self._content_area = self._controls_frame.scrollable_frame
+        self.drag_placeholder = ttk.Frame(self._content_area, height=6, bootstyle='info')
+
+    @contextmanager
+    def _freeze_layout(self):
+        """Detach the app list while rows are created/re-packed so Tk lays it out once."""
+        self._controls_frame.pack_forget()
+        try:
+            yield
+        finally:
+            self._controls_frame.pack(expand=True, fill=tk.BOTH)
+
+    def _build_app_row(self, app_config: AppConfig, index: int) -> dict:
+        """Create (but don't pack) the widgets for one app; returns its ui_elements entry."""
+        content_area = self._content_area
+        app_frame = DraggableAppFrame(content_area, self, app_config, index, padding=(10, 8))
+
+        info_frame = ttk.Frame(app_frame)
+        info_frame.pack(side=tk.LEFT, expand=True, fill=tk.X)
+        name_lbl = ttk.Label(info_frame, text=app_config.name, font="-size 12")
+        name_lbl.pack(side=tk.LEFT, anchor="w")
+        stats_lbl = ttk.Label(info_frame, text="", font="-size 9", bootstyle=INFO)
+        stats_lbl.pack(side=tk.RIGHT, anchor="e", padx=10)
+        switch = ttk.Checkbutton(app_frame, bootstyle="success,round-toggle",
+                                 command=functools.partial(self._toggle_by_name, app_config.name))
+        switch.pack(side=tk.RIGHT, anchor="e")
+
+        elements = {'switch': switch, 'stats_lbl': stats_lbl, 'proc': None, 'frame': app_frame,
+                    'switch_on': None, 'stats_text': '',  # last values pushed to Tk, see _set_switch
+                    'cfg': app_config, 'widgets': [(app_frame, {'fill': tk.X})]}
+        app_frame.bind_events()
+
+        if app_config.script == 'wallch.py':
+            sep_top = tk.Frame(content_area, height=1, bg=SEPARATOR_COLOR)
+            btn_bar = ttk.Frame(content_area)
+            btn_settings = ttk.Button(btn_bar, text="⚙", command=functools.partial(self._open_wallch_by_name, app_config.name), bootstyle=SECONDARY)
+            btn_settings.pack(side=tk.LEFT, padx=10)
+            btn_toggle = ttk.Button(btn_bar, text="▶", command=self.wallch_toggle, bootstyle=INFO)
+            btn_toggle.pack(side=tk.LEFT, padx=6)
+            btn_next = ttk.Button(btn_bar, text="⏭", command=self.wallch_next, bootstyle=SUCCESS)
+            btn_next.pack(side=tk.LEFT, padx=6)
+            sep_bottom = tk.Frame(content_area, height=1, bg=SEPARATOR_COLOR)
+            elements.update({'btn_toggle': btn_toggle, 'btn_next': btn_next})
+            elements['widgets'] += [(sep_top, {'fill': tk.X, 'pady': (5, 10)}),
+                                    (btn_bar, {'fill': tk.X, 'pady': (0, 10)}),
+                                    (sep_bottom, {'fill': tk.X, 'pady': 5})]
+        return elements
+
+    def rebuild_ui(self):
+        """Sync the app rows with self.apps incrementally: rows whose AppConfig is unchanged
+        are kept (and just re-packed if the order changed), new/edited apps get fresh rows,
+        removed apps have their rows destroyed."""
+        if self._controls_frame is None:
+            self._build_static_ui()
+
+        current = {a.name: a for a in self.apps}
+        changed = False
+        with self._freeze_layout():
+            for name, elements in list(self.ui_elements.items()):
+                if current.get(name) is not elements['cfg']:
+                    for widget, _ in elements['widgets']:
+                        widget.destroy()
+                    del self.ui_elements[name]
+                    changed = True
+
+            for i, app_config in enumerate(self.apps):
+                elements = self.ui_elements.get(app_config.name)
+                if elements is None:
+                    self.ui_elements[app_config.name] = self._build_app_row(app_config, i)
+                    changed = True
+                else:
+                    elements['frame'].index = i
+
+            order = [a.name for a in self.apps]
+            if changed or order != self._row_order:
+                for elements in self.ui_elements.values():
+                    for widget, _ in elements['widgets']:
+                        widget.pack_forget()
+                for name in order:
+                    for widget, opts in self.ui_elements[name]['widgets']:
+                        widget.pack(**opts)
+                self._row_order = order
+        # Tk pathname -> row frame, for O(1) drop-target lookup while dragging
+        self._drag_frames = {str(e['frame']): e['frame'] for e in self.ui_elements.values()}
+
+        if self._visible:
             self.position_window()
 
     # --- Drag and Drop Handler Methods ---
@@ -953,15 +1529,34 @@ class AppManager(ttk.Window):
 
     def handle_drag_motion(self, event):
         if self.drag_source_index is None: return
-        target_widget = event.widget.winfo_containing(event.x_root, event.y_root)
-        while target_widget and not isinstance(target_widget, DraggableAppFrame):
-            target_widget = target_widget.master
-        if target_widget and target_widget.index != self.drag_source_index:
+        # Only remember the latest pointer position; the hit-test runs once per idle pass
+        self._drag_pos = (event.x_root, event.y_root)
+        if not self._drag_pending:
+            self._drag_pending = True
+            self.after_idle(self._process_drag)
+
+    def _process_drag(self):
+        self._drag_pending = False
+        if self.drag_source_index is None or self._drag_pos is None: return
+        # Climb at most a few levels (label -> info frame -> row) via a pathname lookup
+        w = self.winfo_containing(*self._drag_pos)
+        target_widget = None
+        for _ in range(4):
+            if w is None:
+                break
+            target_widget = self._drag_frames.get(str(w))
+            if target_widget is not None:
+                break
+            w = w.master
+        if (target_widget and target_widget.index != self.drag_source_index
+                and target_widget.index != self.drag_target_index):
             self.drag_target_index = target_widget.index
             self.drag_placeholder.pack_forget()
             self.drag_placeholder.pack(before=target_widget, fill='x', padx=5, pady=2)
 
     def handle_drop(self):
+        if self._drag_pending:
+            self._process_drag()  # apply the last motion before dropping
         if self.drag_source_index is not None and self.drag_target_index is not None and self.drag_source_index != self.drag_target_index:
             item_to_move = self.apps.pop(self.drag_source_index)
             if self.drag_source_index < self.drag_target_index:
@@ -982,10 +1577,17 @@ class AppManager(ttk.Window):
 
         modified = False  # track whether anything changed
 
-        listbox = tk.Listbox(manager_dialog, height=15, width=50, selectmode=tk.SINGLE)
-        listbox.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+        # Rows keep Tk-generated iids (names aren't enforced unique); tree.index() gives the
+        # position in self.apps, and edits replace the row text in place
+        tree = ttk.Treeview(manager_dialog, show="tree", selectmode="browse", height=15)
+        tree.column("#0", width=360)
+        tree.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
         for app in self.apps:
-            listbox.insert(tk.END, app.name)
+            tree.insert("", "end", text=app.name)
+
+        def selected():
+            sel = tree.selection()
+            return (sel[0], tree.index(sel[0])) if sel else (None, None)
 
         btn_frame = ttk.Frame(manager_dialog, padding=10)
         btn_frame.pack(fill=tk.X)
@@ -996,30 +1598,29 @@ class AppManager(ttk.Window):
             self.wait_window(dialog)
             if dialog.result:
                 self.apps.append(dialog.result)
-                listbox.insert(tk.END, dialog.result.name)
+                tree.insert("", "end", text=dialog.result.name)
                 modified = True
 
         def edit_app():
             nonlocal modified
-            if not listbox.curselection():
+            iid, idx = selected()
+            if iid is None:
                 return
-            idx = listbox.curselection()[0]
             dialog = AddEditAppDialog(self, app_to_edit=self.apps[idx])
             self.wait_window(dialog)
             if dialog.result:
                 self.apps[idx] = dialog.result
-                listbox.delete(idx)
-                listbox.insert(idx, dialog.result.name)
+                tree.item(iid, text=dialog.result.name)
                 modified = True
 
         def remove_app():
             nonlocal modified
-            if not listbox.curselection():
+            iid, idx = selected()
+            if iid is None:
                 return
-            idx = listbox.curselection()[0]
             if messagebox.askyesno("Confirm", f"Remove '{self.apps[idx].name}'?"):
                 del self.apps[idx]
-                listbox.delete(idx)
+                tree.delete(iid)
                 modified = True
 
         saved = {'flag': False}  # closure-friendly box
@@ -1042,6 +1643,7 @@ class AppManager(ttk.Window):
         # Only persist+rebuild if saved and something actually changed
         if saved['flag'] and modified:
             save_apps_to_json(self.apps)
+            self._reindex_apps()
             self.rebuild_ui()
             # Force an immediate status refresh to avoid any “all off” frame
             try:
@@ -1049,15 +1651,29 @@ class AppManager(ttk.Window):
                     self.after_cancel(self.after_id)
             except Exception:
                 pass
+            self._poll_interval = None
             self.update_statuses()
 
+    def _toggle_by_name(self, name: str):
+        """Row switch callback; resolves the row's current AppConfig at click time."""
+        elements = self.ui_elements.get(name)
+        if elements: self.toggle_app(elements['cfg'])
+
+    def _open_wallch_by_name(self, name: str):
+        elements = self.ui_elements.get(name)
+        if elements: self.open_wallpaper_settings(elements['cfg'])
+
     def toggle_app(self, app_config: AppConfig):
         elements = self.ui_elements.get(app_config.name)
         if not elements: return
         btn = elements['switch']
         try: btn.configure(state=tk.DISABLED)
         except Exception: pass
+        elements['switch_on'] = None  # the click flipped the widget itself; resync on the next poll
 
+        # Explicit user action: rescan rather than trust a snapshot from before the click.
+        # start_app/stop_app (and the status poll after them) then share that one scan.
+        invalidate_system_snapshot()
         currently_on = elements['proc'] is not None
         if currently_on:
             stop_app(app_config, elements['proc'])
@@ -1071,8 +1687,7 @@ class AppManager(ttk.Window):
         self.app_state["desired"] = self.desired
         _save_state(self.app_state)
 
-        if self.after_id: self.after_cancel(self.after_id)
-        self.after(500, self.update_statuses)
+        self._schedule_statuses(500)
         self.after(400, lambda: btn.configure(state=tk.NORMAL))
 
     # --- PROFILES ---
@@ -1083,7 +1698,7 @@ class AppManager(ttk.Window):
             # Clear selected profile (no changes to running apps), just forget the mark
             self.app_state["last_profile"] = None
             _save_state(self.app_state)
-            self.refresh_tray_menu()
+            self._request_tray_refresh()
             return
 
         mapping = self.profiles.get(profile_name, {})
@@ -1091,31 +1706,82 @@ class AppManager(ttk.Window):
             return
 
         # Only touch apps mentioned in mapping; leave others alone.
+        to_start, to_stop = [], []
         for app in self.apps:
             if app.name not in mapping:
                 continue
             want = bool(mapping[app.name])
-            have = self.ui_elements.get(app.name, {}).get('proc') is not None
-            # Update desired ONLY for the apps we touch
-            self.desired[app.name] = want
-            if want and not have:
-                start_app(app); _log_line(app.name, f"profile '{profile_name}': start")
-            elif not want and have:
-                stop_app(app, self.ui_elements.get(app.name, {}).get('proc')); _log_line(app.name, f"profile '{profile_name}': stop")
+            proc = self.ui_elements.get(app.name, {}).get('proc')
+            if want and proc is None:
+                to_start.append(app)
+            elif not want and proc is not None:
+                to_stop.append((app, proc))
+        # Update desired ONLY for the apps we touch
+        self.desired.update({name: bool(want) for name, want in mapping.items()
+                             if name in self._proc_name_lc})
+
+        # Kills (taskkill waits) and launches run side by side: stops first, then starts.
+        # Workers never touch Tk (this thread is blocked joining them): start errors are
+        # collected and shown once the pool has drained.
+        errors: List[Tuple[str, str]] = []
+
+        def report(title, message):
+            errors.append((title, message))
+
+        def stop(item):
+            app, proc = item
+            stop_app(app, proc); _log_line(app.name, f"profile '{profile_name}': stop")
+
+        def start(app):
+            start_app(app, snap, report); _log_line(app.name, f"profile '{profile_name}': start")
+
+        if to_stop or to_start:
+            with ThreadPoolExecutor(max_workers=min(8, max(len(to_stop), len(to_start)))) as pool:
+                list(pool.map(stop, to_stop))
+                snap = get_system_snapshot()  # one scan shared by every start below
+                list(pool.map(start, to_start))
+        for title, message in errors:
+            messagebox.showerror(title, message)
 
         self.app_state["desired"] = self.desired
         self.app_state["last_profile"] = profile_name
         _save_state(self.app_state)
-        self.after(300, self.update_statuses)
-        self.refresh_tray_menu()
+        self._schedule_statuses(300)
+        self._request_tray_refresh()
 
 
     # --- AUTORESTART + STATS ---
+    def _schedule_statuses(self, delay_ms: int):
+        """(Re)arm the one status-poll timer; never stacks a second polling chain.
+        Called after user actions, so it also drops the idle backoff back to the base rate."""
+        self._poll_interval = None
+        if self.after_id:
+            try: self.after_cancel(self.after_id)
+            except Exception: pass
+        self.after_id = self.after(delay_ms, self.update_statuses)
+
+    # Tk setters that skip the Tcl round-trip when the widget already shows the value
+    @staticmethod
+    def _set_switch(elements: dict, on: bool):
+        if elements.get('switch_on') is not on:
+            elements['switch'].state(['selected' if on else '!selected'])
+            elements['switch_on'] = on
+
+    @staticmethod
+    def _set_stats_text(elements: dict, text: str):
+        if elements.get('stats_text') != text:
+            elements['stats_lbl'].config(text=text)
+            elements['stats_text'] = text
+
     def update_statuses(self):
-        # 1. Only iterate all processes if we absolutely have to find a missing PID
-        # We do this lazily inside the loop below only when needed.
-        
-        running_names_cache = None 
+        # While only the tray icon is showing, keep liveness + auto-restart but skip
+        # the per-process CPU/memory reads and poll half as often.
+        hidden = not self._visible
+
+        # One process-table walk per tick, shared by the liveness checks, the lookups for
+        # missing apps and auto-restart (no per-handle is_running()/name() calls)
+        snap = get_system_snapshot()
+        changed = False  # any start/stop/restart or a material stats move resets the backoff
 
         for app_config in self.apps:
             elements = self.ui_elements.get(app_config.name)
@@ -1123,68 +1789,97 @@ class AppManager(ttk.Window):
             
             cached_proc = elements.get('proc')
             
-            # A. Fast Path: We already have a handle, check if it's alive
+            # A. Fast Path: the cached pid is still in the table under the name it had when
+            # the handle was taken, and with the same start time, i.e. the pid has not been
+            # reused by another program
             is_alive = False
-            if cached_proc:
-                try:
-                    if cached_proc.is_running():
-                        # Double check it hasn't been reused by a different process name
-                        # (rare but possible)
-                        if cached_proc.name().lower() == app_config.process_name.lower():
-                            is_alive = True
-                    else:
+            if cached_proc is not None and snap.names.get(cached_proc.pid) == elements.get('proc_name_lc'):
+                ctime, known = snap.ctimes.get(cached_proc.pid), elements.get('proc_ctime')
+                if ctime is not None:
+                    is_alive = known is None or ctime == known
+                else:
+                    # Toolhelp32 has no start time: let psutil re-read it and compare (one
+                    # OpenProcess, and only for a pid whose name still matches)
+                    try:
+                        is_alive = cached_proc.is_running()
+                    except psutil.Error:
                         is_alive = False
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    is_alive = False
             
-            # B. Slow Path: We don't have a handle, or it died. Scan system.
+            # B. Slow Path: We don't have a handle, or it died. Look it up in the snapshot.
             if not is_alive:
-                # Only fetch the massive system list ONCE per update cycle, and only if needed
-                if running_names_cache is None:
-                    running_names_cache = _aggregate_proc_dict() # Your existing helper
-                
-                new_proc = find_process(app_config, running_names_cache)
+                new_proc = find_process(app_config, snap, self._proc_name_lc.get(app_config.name))
                 if new_proc:
+                    # name/start time never change for a process: memoize them per handle
+                    elements['proc_name_lc'] = snap.names.get(new_proc.pid)
+                    elements['proc_ctime'] = None
+                    try:
+                        elements['proc_ctime'] = new_proc.create_time()
+                        new_proc.cpu_percent()  # prime: the first call on a handle always returns 0.0
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        pass
                     elements['proc'] = new_proc
                     is_alive = True
+                    changed = True
                     
             # Update UI based on is_alive
-            if is_alive:
+            if is_alive and hidden:
+                self._set_switch(elements, True)
+            elif is_alive:
                 # Update stats...
                 try:
                     p = elements['proc']
-                    cpu = p.cpu_percent()
-                    mem = p.memory_info().rss / (1024 * 1024)
-                    elements['stats_lbl'].config(text=f"CPU: {cpu:.1f}% | Mem: {mem:.1f} MB")
-                    elements['switch'].state(['selected'])
+                    with p.oneshot():  # cpu + memory from a single process-info query
+                        cpu = p.cpu_percent()
+                        mem = p.memory_info().rss / (1024 * 1024)
+                    last = elements.get('last_stats')
+                    if (last is None or abs(cpu - last[0]) > STATS_CPU_DELTA
+                            or abs(mem - last[1]) > STATS_MEM_DELTA):
+                        elements['last_stats'] = (cpu, mem)
+                        changed = True
+                    self._set_stats_text(elements, f"CPU: {cpu:.1f}% | Mem: {mem:.1f} MB")
+                    self._set_switch(elements, True)
                 except:
                     elements['proc'] = None # Handle race condition where it dies mid-check
+                    elements['proc_name_lc'] = elements['proc_ctime'] = None
+                    changed = True
             else:
-                elements['switch'].state(['!selected'])
-                elements['stats_lbl'].config(text="")
+                if cached_proc is not None:
+                    changed = True
+                elements['last_stats'] = None
+                self._set_switch(elements, False)
+                self._set_stats_text(elements, "")
                 elements['proc'] = None
+                elements['proc_name_lc'] = elements['proc_ctime'] = None
                 
                 # Auto-restart logic here...
-                if self.desired.get(app_config.name, False):
-                    start_app(app_config)
+                if self.desired.get(app_config.name, False) and _single_instance_ready.is_set():
+                    start_app(app_config, snap)
                     _log_line(app_config.name, "auto-restart (not running)")
+                    changed = True
 
-        self.update_wallch_ui()
-        self.after_id = self.after(2500, self.update_statuses)
+        if not hidden:
+            self.update_wallch_ui()
+        base = POLL_MS_HIDDEN if hidden else POLL_MS_VISIBLE
+        if changed or self._poll_interval is None:
+            self._poll_interval = base
+        else:
+            self._poll_interval = min(int(max(self._poll_interval, base) * POLL_BACKOFF), POLL_MS_MAX)
+        self.after_id = self.after(self._poll_interval, self.update_statuses)
 
     def update_wallch_ui(self):
-        wallch_app = next((app for app in self.apps if app.script == 'wallch.py'), None)
+        wallch_app = self._apps_by_script.get('wallch.py')
         if not (wallch_app and wallch_app.name in self.ui_elements): return
         elements = self.ui_elements[wallch_app.name]
         if 'btn_toggle' not in elements: return
         is_running = elements['proc'] is not None
         state = read_wallch_status() if is_running else "Stopped"
+        shown = (is_running, is_running and state == "Playing")
+        if elements.get('wallch_shown') == shown:
+            return  # buttons already reflect this
+        elements['wallch_shown'] = shown
         elements['btn_next'].config(state=tk.NORMAL if is_running else tk.DISABLED)
-        elements['btn_toggle'].config(state=tk.NORMAL if is_running else tk.DISABLED)
-        if is_running and state == "Playing":
-            elements['btn_toggle'].config(text="⏸")
-        else:
-            elements['btn_toggle'].config(text="▶")
+        elements['btn_toggle'].config(state=tk.NORMAL if is_running else tk.DISABLED,
+                                      text="⏸" if shown[1] else "▶")
             
     def open_wallpaper_settings(self, app_config):
         current = load_wallch_settings()
@@ -1205,7 +1900,7 @@ class AppManager(ttk.Window):
         self.app_state["autostart"] = new_val
         _save_state(self.app_state)
         _set_startup_enabled(new_val)
-        self.refresh_tray_menu()
+        self._request_tray_refresh()
 
     # Add this helper method inside AppManager (just above refresh_tray_menu)
     def _tk_cb(self, fn, *args, **kwargs):
@@ -1214,14 +1909,34 @@ class AppManager(ttk.Window):
             self.after(0, lambda: fn(*args, **kwargs))
         return _cb
 
+    def _request_tray_refresh(self):
+        """Coalesce tray updates: profile apply + autostart flips in a burst rebuild once."""
+        if self._tray_refresh_id is None:
+            self._tray_refresh_id = self.after(80, self._flush_tray_refresh)
+
+    def _flush_tray_refresh(self):
+        self._tray_refresh_id = None
+        self.refresh_tray_menu()
+
     def refresh_tray_menu(self):
+        # Check marks are callables read when the menu is drawn; unless the profile list
+        # changed, only ask pystray to re-read them instead of rebuilding every item
+        key = tuple(sorted(self.profiles))
+        if self.tray_icon and self.tray_icon.menu and key == self._tray_menu_key:
+            try:
+                self.tray_icon.update_menu()
+                return
+            except Exception:
+                pass
+        self._tray_menu_key = key
+
         def clear_profile():
             self.apply_profile(None)
 
         # Profiles submenu (only apply actions; no “Manage Profiles…” here)
         if self.profiles:
             profile_items = []
-            for prof_name in sorted(self.profiles.keys()):
+            for prof_name in key:
                 def make_action(name=prof_name):
                     return self._tk_cb(self.apply_profile, name)
                 def is_checked(item, name=prof_name):
@@ -1254,13 +1969,13 @@ class AppManager(ttk.Window):
 
 
     def setup_tray_icon(self):
-        try: image = Image.open(APP_DIR / "icon.png")
-        except: image = Image.new("RGBA", (64, 64), (30, 30, 30, 255))
-        self.tray_icon = pystray.Icon("The Control", image, "The Control", pystray.Menu())  # temp
+        self.tray_icon = pystray.Icon("The Control", _TRAY_IMAGE, "The Control", pystray.Menu())  # temp
         self.refresh_tray_menu()
         threading.Thread(target=self.tray_icon.run, daemon=True).start()
 
     def show_window(self):
+        self._visible = True
+        self._work_area = None
         # Place before show to avoid flicker at (0, 0)
         self.update_idletasks()
         self.position_window()
@@ -1272,6 +1987,7 @@ class AppManager(ttk.Window):
         self.deiconify()
         self.lift()
         self.focus_force()
+        self._schedule_statuses(0)  # stats/wallpaper buttons were not refreshed while hidden
 
         def _fade_in():
             try:
@@ -1281,15 +1997,14 @@ class AppManager(ttk.Window):
         self.after(10, _fade_in)
 
     def hide_window(self):
+        self._visible = False
         self.withdraw()
 
     def quit_window(self):
         if self.after_id:
             self.after_cancel(self.after_id)
-        try:
-            CMD_FILE.write_text("quit\n", encoding="utf-8")
-        except Exception:
-            pass
+        _json_writer.flush()  # write now rather than relying on atexit after destroy()
+        send_wallch_command("quit")
         time.sleep(0.3)
         self.update_statuses()
         if self.tray_icon:
@@ -1301,7 +2016,8 @@ if __name__ == "__main__":
     try: ctypes.windll.shcore.SetProcessDpiAwareness(2)
     except: pass
 
-    _kill_other_control_instances()
+    # Scan/kill older instances while Tk builds the window
+    threading.Thread(target=_kill_other_control_instances_async, daemon=True).start()
 
     app = AppManager()
     app.mainloop()
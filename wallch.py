@@ -1,9 +1,11 @@
 # wallch.py
 import argparse
 import ctypes
+from ctypes import wintypes
 import os
 import random
 import time
+from dataclasses import dataclass
 from pathlib import Path
 import atexit
 
@@ -12,74 +14,140 @@ SPIF_UPDATEINIFILE = 0x01
 SPIF_SENDCHANGE = 0x02
 
 IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".bmp"}
+_IMAGE_EXTS_BARE = frozenset(e[1:] for e in IMAGE_EXTS)  # for name.rpartition('.') checks
 
 STATUS_PATH = Path(__file__).resolve().with_name("wallch.status")
+# Auto-reset event the control app sets after writing wallch.cmd (same name in control.py).
+# Object names can't contain backslashes after the namespace, so it is not keyed on the folder.
+CMD_EVENT_NAME = "Local\\wallch::cmd"
+INFINITE = 0xFFFFFFFF
+
+# Win32 prototypes, bound once (argtypes/restype: no per-call argument guessing, full-width HANDLEs)
+if os.name == "nt":
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _SystemParametersInfoW = _user32.SystemParametersInfoW
+    _SystemParametersInfoW.argtypes = (wintypes.UINT, wintypes.UINT, wintypes.LPCWSTR, wintypes.UINT)
+    _SystemParametersInfoW.restype = wintypes.BOOL
+    _CreateMutexW = _kernel32.CreateMutexW
+    _CreateMutexW.argtypes = (wintypes.LPVOID, wintypes.BOOL, wintypes.LPCWSTR)
+    _CreateMutexW.restype = wintypes.HANDLE
+    _CreateEventW = _kernel32.CreateEventW
+    _CreateEventW.argtypes = (wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR)
+    _CreateEventW.restype = wintypes.HANDLE
+    _WaitForSingleObject = _kernel32.WaitForSingleObject
+    _WaitForSingleObject.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+    _WaitForSingleObject.restype = wintypes.DWORD
 
 def ensure_single_instance(key: str):
     ERROR_ALREADY_EXISTS = 183
-    handle = ctypes.windll.kernel32.CreateMutexW(None, False, key)
+    handle = _CreateMutexW(None, False, key)
     # Keep the handle alive for process lifetime; don't close it.
-    if ctypes.GetLastError() == ERROR_ALREADY_EXISTS:
+    if ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
         print("[wallch] another instance is already running; exiting.")
         raise SystemExit(0)
     return handle
 
+_last_status: str | None = None  # last state actually on disk
+
 def write_status(state: str):
+    """Publish state for control.py; skipped when unchanged, replaced atomically otherwise."""
+    global _last_status
+    if state == _last_status:
+        return
     try:
-        STATUS_PATH.write_text(state + "\n", encoding="utf-8")
+        tmp = STATUS_PATH.with_name(STATUS_PATH.name + ".tmp")
+        tmp.write_text(state + "\n", encoding="utf-8")
+        os.replace(tmp, STATUS_PATH)
+        _last_status = state
     except Exception:
         pass
 
+# style -> (TileWallpaper, WallpaperStyle) registry values
+_STYLE_MAP = {
+    "fill":     ("0", "10"),
+    "fit":      ("0", "6"),
+    "stretch":  ("0", "2"),
+    "center":   ("0", "0"),
+    "tile":     ("1", "0"),
+    "span":     ("0", "22"),  # multi-monitor span
+}
+
 def set_wallpaper_style(style: str):
-    style = style.lower()
-    mapping = {
-        "fill":     ("0", "10"),
-        "fit":      ("0", "6"),
-        "stretch":  ("0", "2"),
-        "center":   ("0", "0"),
-        "tile":     ("1", "0"),
-        "span":     ("0", "22"),  # multi-monitor span
-    }
-    if style not in mapping:
-        raise ValueError(f"Unknown style '{style}'. Use one of: {', '.join(mapping)}")
-    tile, wp_style = mapping[style]
+    try:
+        tile, wp_style = _STYLE_MAP[style.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown style '{style}'. Use one of: {', '.join(_STYLE_MAP)}") from None
     import winreg
     with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Control Panel\Desktop", 0, winreg.KEY_SET_VALUE) as key:
         winreg.SetValueEx(key, "TileWallpaper", 0, winreg.REG_SZ, tile)
         winreg.SetValueEx(key, "WallpaperStyle", 0, winreg.REG_SZ, wp_style)
 
-def apply_wallpaper(image_path: Path):
-    ok = ctypes.windll.user32.SystemParametersInfoW(
-        SPI_SETDESKWALLPAPER, 0, str(image_path),
+def apply_wallpaper(image_path: str):
+    ok = _SystemParametersInfoW(
+        SPI_SETDESKWALLPAPER, 0, image_path,
         SPIF_UPDATEINIFILE | SPIF_SENDCHANGE
     )
     if not ok:
         raise OSError(f"Failed to set wallpaper: {image_path}")
 
-def gather_images(folder: Path, recursive: bool) -> list[Path]:
-    if recursive:
-        files = [p for p in folder.rglob("*") if p.suffix.lower() in IMAGE_EXTS]
-    else:
-        files = [p for p in folder.iterdir() if p.is_file() and p.suffix.lower() in IMAGE_EXTS]
-    files.sort()
+def gather_images(folder: Path, recursive: bool) -> list[str]:
+    """Image paths (plain strings, sorted case-insensitively) under folder.
+    os.scandir reuses the directory entry's type info, so no per-file stat."""
+    files = []
+    stack = [str(folder)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_file():
+                    stem, _, ext = entry.name.rpartition(".")
+                    if stem and ext.lower() in _IMAGE_EXTS_BARE:  # '.png' alone has no suffix
+                        files.append(entry.path)
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    files.sort(key=str.lower)
     return files
 
-def read_command(cmd_file: Path) -> str | None:
-    """Read and clear a one-line command file if present."""
+@dataclass
+class WallchCtx:
+    """Everything the main loop talks to the control app through, resolved once in main()."""
+    mutex: int             # single-instance mutex; held (never closed) for the process lifetime
+    event: int | None      # command event, see create_command_event (None -> polling fallback)
+    cmd_file: Path
+
+def create_command_event():
+    """Event signalled by control.py on every command; None if it can't be created."""
     try:
-        if cmd_file.exists():
-            txt = cmd_file.read_text(encoding="utf-8").strip().lower()
-            cmd_file.unlink(missing_ok=True)  # consume once
-            if txt:
-                return txt
+        return _CreateEventW(None, False, False, CMD_EVENT_NAME) or None
+    except Exception:
+        return None
+
+def wait_for_command(ctx: WallchCtx, timeout_ms: int | None):
+    """Block until a command is signalled or `timeout_ms` passes (None = no limit).
+    Without an event, fall back to short sleeps so the command file is still polled."""
+    if ctx.event:
+        _WaitForSingleObject(ctx.event, INFINITE if timeout_ms is None else timeout_ms)
+    else:
+        time.sleep(0.25 if timeout_ms is None else min(250, timeout_ms) / 1000)
+
+def read_command(ctx: WallchCtx) -> str | None:
+    """Read and clear a one-line command file if present (no exists() pre-check)."""
+    try:
+        data = ctx.cmd_file.read_bytes()
+        ctx.cmd_file.unlink(missing_ok=True)  # consume once
+    except FileNotFoundError:
+        return None
     except Exception:
         # ignore transient file errors
-        pass
-    return None
+        return None
+    return data.decode("utf-8", "ignore").strip().lower() or None
 
 def _on_exit():
-    try: STATUS_PATH.write_text("Stopped\n", encoding="utf-8")
-    except Exception: pass
+    write_status("Stopped")
 
 atexit.register(_on_exit)
 
@@ -87,7 +155,7 @@ def main():
     parser = argparse.ArgumentParser(description="Rotate Windows wallpaper from a folder.")
     parser.add_argument("folder", type=Path, help="Folder containing images")
     parser.add_argument("--interval", type=int, default=600, help="Seconds between changes (default: 600)")
-    parser.add_argument("--style", default="fill", choices=["fill","fit","stretch","center","tile","span"],
+    parser.add_argument("--style", default="fill", choices=list(_STYLE_MAP),
                         help="Wallpaper display style (default: fill)")
     parser.add_argument("--shuffle", action="store_true", help="Shuffle image order")
     parser.add_argument("--recursive", action="store_true", help="Search folder recursively")
@@ -113,8 +181,20 @@ def main():
     if not images:
         raise SystemExit(f"No images found in {folder} (extensions: {', '.join(sorted(IMAGE_EXTS))})")
 
+    # Play through an index permutation; `images` itself stays sorted and is never moved.
+    # With --shuffle every full pass gets a fresh order.
+    order = list(range(len(images)))
     if args.shuffle:
-        random.shuffle(images)
+        random.shuffle(order)
+    shuffled_pass = 0
+
+    def image_at(i: int) -> str:
+        nonlocal shuffled_pass
+        n_pass, pos = divmod(i, len(order))
+        if args.shuffle and n_pass != shuffled_pass:
+            random.shuffle(order)
+            shuffled_pass = n_pass
+        return images[order[pos]]
 
     try:
         set_wallpaper_style(args.style)
@@ -127,12 +207,16 @@ def main():
     paused = False
     index = 0
     next_requested = False  # <-- lives across loop iterations
-    _ = ensure_single_instance(f"Global\\wallch::{str(folder).lower()}")
+    ctx = WallchCtx(
+        mutex=ensure_single_instance(f"Global\\wallch::{str(folder).lower()}"),
+        event=create_command_event(),
+        cmd_file=cmd_file,
+    )
     write_status("Playing" if not args.once else "Playing")
 
     while True:
         # --- Handle any immediate command at the top ---
-        cmd = read_command(cmd_file)
+        cmd = read_command(ctx)
         if cmd:
             if cmd in ("pause", "resume", "toggle", "next", "quit"):
                 if cmd == "pause":
@@ -159,8 +243,8 @@ def main():
 
         # If paused and Next was requested, apply one image now (stay paused)
         if paused and next_requested:
-            img = images[index % len(images)]
-            if img.exists():
+            img = image_at(index)
+            if os.path.exists(img):
                 try:
                     apply_wallpaper(img)
                     write_status("Paused")  # keep UI correct
@@ -173,8 +257,8 @@ def main():
 
         # Normal apply when not paused
         if not paused:
-            img = images[index % len(images)]
-            if not img.exists():
+            img = image_at(index)
+            if not os.path.exists(img):
                 print(f"[wallch] missing image skipped: {img}")
                 index += 1
             else:
@@ -192,16 +276,17 @@ def main():
                 # IMPORTANT: advance after a normal apply
                 index += 1
 
-        # --- Monotonic wait (no drift) ---
-        remaining = max(1, args.interval)
-        next_deadline = time.monotonic() + remaining
-        step = 0.25  # polling granularity (you can use 0.5 if you like)
+        # --- Monotonic wait (no drift): sleep on the command event until the deadline ---
+        # Integer nanosecond deadline; one clock read per wake-up
+        interval_ns = max(1, args.interval) * 1_000_000_000
+        deadline_ns = time.monotonic_ns() + interval_ns
 
         while True:
-            time.sleep(step)
+            was_paused = paused
+            wait_for_command(ctx, None if paused else max(0, -((time.monotonic_ns() - deadline_ns) // 1_000_000)))  # ceil ms: never wake early
 
             # consume commands responsively
-            cmd = read_command(cmd_file)
+            cmd = read_command(ctx)
             if cmd:
                 if cmd == "next":
                     index += 1
@@ -224,13 +309,14 @@ def main():
                     print("[wallch] quitting by command")
                     return
 
+            now_ns = time.monotonic_ns()
+            if paused or was_paused:
+                # the deadline is held while paused: a resume starts a fresh interval
+                deadline_ns = now_ns + interval_ns
             if paused:
-                # hold the deadline while paused (and be a bit gentler on wakeups)
-                next_deadline = time.monotonic() + remaining
-                time.sleep(0.5)
                 continue
 
-            if time.monotonic() >= next_deadline:
+            if now_ns >= deadline_ns:
                 break
 
 if __name__ == "__main__":